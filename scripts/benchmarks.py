@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the US Economic Event Fetcher
+Measures the hot paths of us_event_fetcher.py on synthetic data so runs are
+repeatable offline. Run all benchmarks or pick some by name:
+
+    python scripts/benchmarks.py
+    python scripts/benchmarks.py html_parsing
+"""
+
+import argparse
+import bisect
+import gc
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+from datetime import date, datetime, timedelta
+
+import us_event_fetcher as uef
+from bs4 import BeautifulSoup
+
+logging.getLogger(uef.__name__).setLevel(logging.WARNING)
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def measure(func: Callable, repeat: int = 5) -> Tuple[float, int]:
+    """Return (best wall time in seconds, peak traced memory in bytes) for func()"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def report(title: str, rows: Dict[str, Tuple[float, int]]):
+    """Print a small table of timing/memory results"""
+    print(f"\n== {title} ==")
+    print(f"{'variant':<32}{'time (ms)':>12}{'peak mem (KiB)':>18}")
+    for name, (seconds, peak) in rows.items():
+        print(f"{name:<32}{seconds * 1000:>12.2f}{peak / 1024:>18.1f}")
+
+
+# ============================================================================
+# SYNTHETIC DATA
+# ============================================================================
+
+def forex_factory_page(rows: int = 2000) -> bytes:
+    """A calendar page shaped like Forex Factory's: chrome around one big table"""
+    names = ['CPI m/m', 'Non-Farm Employment Change', 'Retail Sales m/m',
+             'Unemployment Claims', 'Crude Oil Inventories', 'ISM Services PMI']
+    chrome = ''.join(f'<div class="nav"><a href="/p{i}">Link {i}</a><span>{i}</span></div>'
+                     for i in range(rows // 2))
+    body = ''.join(
+        f'<tr class="calendar__row"><td>Jan {i % 28 + 1}, 2027 8:30am</td>'
+        f'<td><span class="icon--ff-impact-red">High</span></td>'
+        f'<td>{names[i % len(names)]}</td><td></td><td>0.{i % 9}%</td>'
+        f'<td>0.{(i + 1) % 9}%</td><td></td></tr>'
+        for i in range(rows)
+    )
+    return (f'<html><head><script>var x = 1;</script></head><body>{chrome}'
+            f'<table class="calendar__table">{body}</table>{chrome}</body></html>').encode('utf-8')
+
+
+def fed_calendar_page(links: int = 400) -> bytes:
+    """A page shaped like fomccalendars.htm: many links, a few FOMC ones"""
+    items = []
+    for i in range(links):
+        text = f'FOMC Meeting January {i % 28 + 1}, 2027' if i % 20 == 0 else f'Related item {i}'
+        items.append(f'<div class="panel"><p>Paragraph {i}</p><a href="/item{i}.htm">{text}</a></div>')
+    return f'<html><body>{"".join(items)}</body></html>'.encode('utf-8')
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def bench_html_parsing():
+    """html.parser full tree vs lxml full tree vs lxml restricted to needed tags"""
+    ff_page = forex_factory_page()
+    fed_page = fed_calendar_page()
+    ff_strainer = uef.ForexFactoryFetcher.ROW_STRAINER
+    fed_strainer = uef.FedCalendarFetcher.LINK_STRAINER
+
+    report(f"Forex Factory rows ({len(ff_page) / 1024:.0f} KiB page)", {
+        'html.parser, full tree': measure(
+            lambda: BeautifulSoup(ff_page, 'html.parser').find_all('tr')),
+        'lxml, full tree': measure(
+            lambda: BeautifulSoup(ff_page, 'lxml').find_all('tr')),
+        'lxml, SoupStrainer(tr)': measure(
+            lambda: BeautifulSoup(ff_page, 'lxml', parse_only=ff_strainer).find_all('tr')),
+    })
+    report(f"Fed FOMC links ({len(fed_page) / 1024:.0f} KiB page)", {
+        'html.parser, full tree': measure(
+            lambda: BeautifulSoup(fed_page, 'html.parser').find_all('a', href=True)),
+        'lxml, full tree': measure(
+            lambda: BeautifulSoup(fed_page, 'lxml').find_all('a', href=True)),
+        'lxml, SoupStrainer(a[href])': measure(
+            lambda: BeautifulSoup(fed_page, 'lxml', parse_only=fed_strainer).find_all('a', href=True)),
+    })
+
+
+def bench_timezone_conversion():
+    """ZoneConverter vs per-event pytz localize(), checked against localize()"""
+    start = datetime(2020, 1, 1, 0, 30)
+    # Every 20 minutes for ~4 years: crosses every DST transition in range
+    local_times = [start + timedelta(minutes=20 * i) for i in range(105_000)]
+    zone = uef.US_EASTERN
+
+    expected = [zone.localize(t).astimezone(uef.UTC) for t in local_times]
+    converted = uef.ZoneConverter(zone).to_utc_many(local_times)
+    mismatches = sum(1 for a, b in zip(expected, converted) if a != b)
+    lmt_wrong = sum(1 for t, b in zip(local_times, expected)
+                    if t.replace(tzinfo=zone).astimezone(uef.UTC) != b)
+    print(f"\n{len(local_times)} US/Eastern wall times, 2020-2024")
+    print(f"  ZoneConverter mismatches vs localize(): {mismatches}")
+    print(f"  replace(tzinfo=...) (old path) wrong:   {lmt_wrong}")
+
+    report("US/Eastern -> UTC throughput", {
+        'localize().astimezone(UTC)': measure(
+            lambda: [zone.localize(t).astimezone(uef.UTC) for t in local_times], repeat=3),
+        'ZoneConverter (cold cache)': measure(
+            lambda: uef.ZoneConverter(zone).to_utc_many(local_times), repeat=3),
+        'ZoneConverter (warm cache)': measure(
+            lambda: uef.EASTERN.to_utc_many(local_times), repeat=3),
+    })
+
+
+class _LegacyEvent:
+    """The pre-slots EconomicEvent layout: per-instance __dict__ and a datetime"""
+
+    def __init__(self, name, event_time_utc, impact, forecast=None,
+                 previous=None, actual=None, source='Unknown'):
+        self.name = name
+        self.event_time_utc = event_time_utc
+        self.impact = impact
+        self.forecast = forecast
+        self.previous = previous
+        self.actual = actual
+        self.source = source
+
+
+def bench_event_memory():
+    """Memory per event: legacy __dict__ + datetime vs slotted epoch-ms EconomicEvent"""
+    count = 100_000
+    names = ['CPI m/m', 'Non-Farm Employment Change', 'Retail Sales m/m', 'FOMC Press Conference']
+    start = datetime(2020, 1, 1, 12, 30, tzinfo=uef.UTC)
+
+    def build(cls):
+        # Strings and datetimes are created fresh per event, as parsing does
+        gc.collect()
+        tracemalloc.start()
+        events = [cls(f"{names[i % len(names)]}", start + timedelta(hours=i),
+                      f"{'High'}", source=f"Forex {'Factory'}")
+                  for i in range(count)]
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return events, current
+
+    legacy, legacy_bytes = build(_LegacyEvent)
+    del legacy
+    slotted, slotted_bytes = build(uef.EconomicEvent)
+    del slotted
+
+    print(f"\n== Retained memory per event ({count} events, incl. list) ==")
+    print(f"  legacy (__dict__ + datetime): {legacy_bytes / count:8.1f} bytes")
+    print(f"  EconomicEvent (__slots__):    {slotted_bytes / count:8.1f} bytes")
+
+
+def bench_schedule_load(years: int = 10):
+    """Multi-year fallback schedule (weekly series included) through merge and output"""
+    fetcher = uef.HardcodedFetcher()
+    start = datetime(2016, 1, 1, tzinfo=uef.UTC)
+    end = start.replace(year=start.year + years)
+    events = list(fetcher.iter_events(start, end))
+    deduplicator = uef.EventDeduplicator()
+    merged = deduplicator.merge(events)
+    table = uef.EventTable.from_events(merged)
+    weekly = sum(1 for e in events if e.name in ('Jobless Claims', 'Continuing Jobless Claims',
+                                                  'MBA Mortgage Applications'))
+
+    # Friday Jan 1 is a holiday: NFP moves to the next Friday, not into December
+    nfp = uef.NthWeekday(1, uef.FRIDAY, roll='preceding')
+    for year in (2021, 2027):
+        assert list(nfp.expand(date(year - 1, 12, 1), date(year, 2, 1))) == [
+            date(year - 1, 12, 4), date(year, 1, 8)], year
+
+    print(f"\n{years} years of schedule: {len(events)} events ({weekly} from weekly series)")
+    report("Schedule load test", {
+        'expand schedule': measure(lambda: list(fetcher.iter_events(start, end)), repeat=3),
+        'merge duplicates': measure(lambda: deduplicator.merge(events), repeat=3),
+        'EventTable + filter': measure(
+            lambda: uef.EventTable.from_events(merged).filter_impact('High', 'Medium'), repeat=3),
+        'Pine output': measure(lambda: uef.PineScriptGenerator.generate_pine_arrays(table), repeat=3),
+        'JSON output': measure(lambda: uef.JSONGenerator.generate_json(table), repeat=3),
+    })
+
+
+def bench_streaming_pipeline(years: int = 10):
+    """Materialize-then-write vs the streaming pipeline, schedule source to Pine output"""
+    fetcher = uef.HardcodedFetcher()
+    start = datetime(2016, 1, 1, tzinfo=uef.UTC)
+    end = start.replace(year=start.year + years)
+    deduplicator = uef.EventDeduplicator()
+
+    def materialized():
+        events = deduplicator.merge(list(fetcher.iter_events(start, end)))
+        table = uef.EventTable.from_events(events).filter_impact('High', 'Medium')
+        return uef.PineScriptGenerator.generate_pine_arrays(table)
+
+    def streaming():
+        stream = (e for e in fetcher.iter_events(start, end) if e.impact in ('High', 'Medium'))
+        with open(os.devnull, 'w') as sink:
+            return uef.write_events(deduplicator.merge_sorted(stream), [uef.PineScriptWriter(sink)])
+
+    report(f"{years} years of schedule to Pine", {
+        'materialize, then write': measure(materialized, repeat=3),
+        'streaming pipeline': measure(streaming, repeat=3),
+    })
+
+
+def bench_json_output(years: int = 25):
+    """Whole-document json.dumps vs the streaming JSONWriter, stdlib and orjson"""
+    start = datetime(2016, 1, 1, tzinfo=uef.UTC)
+    end = start.replace(year=start.year + years)
+    events = uef.EventDeduplicator().merge(uef.HardcodedFetcher().iter_events(start, end))
+
+    def legacy():
+        data = {'metadata': uef.JSONGenerator.metadata(len(events)),
+                'events': [event.to_dict() for event in events]}
+        with open(os.devnull, 'w') as sink:
+            sink.write(json.dumps(data, indent=2, default=str))
+
+    def streaming(compact, fast):
+        def run():
+            with open(os.devnull, 'w') as sink:
+                uef.write_events(events, [uef.JSONWriter(sink, compact=compact, fast=fast)])
+        return run
+
+    variants = {'json.dumps(whole document)': legacy}
+    for fast in ([False, True] if uef.orjson is not None else [False]):
+        encoder = 'orjson' if fast else 'stdlib'
+        variants[f'JSONWriter, {encoder}, indent=2'] = streaming(False, fast)
+        variants[f'JSONWriter, {encoder}, compact'] = streaming(True, fast)
+
+    rows = {name: measure(func, repeat=3) for name, func in variants.items()}
+    report(f"JSON output ({len(events)} events)", rows)
+    print(f"{'variant':<32}{'events/s':>12}")
+    for name, (seconds, _) in rows.items():
+        print(f"{name:<32}{len(events) / seconds:>12,.0f}")
+
+
+def bench_binary_load(years: int = 25):
+    """Bot start-up: load events.json / events.ndjson vs mmap events.bin, then find the next event"""
+    start = datetime(2016, 1, 1, tzinfo=uef.UTC)
+    end = start.replace(year=start.year + years)
+    events = uef.EventDeduplicator().merge(uef.HardcodedFetcher().iter_events(start, end))
+    probe_ms = events[len(events) // 2].timestamp_ms + 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'events.json')
+        ndjson_path = os.path.join(tmp, 'events.ndjson')
+        binary_path = os.path.join(tmp, 'events.bin')
+        with open(json_path, 'w', encoding='utf-8') as json_file, \
+                open(ndjson_path, 'w', encoding='utf-8') as ndjson_file, \
+                open(binary_path, 'wb') as binary_file:
+            uef.write_events(events, [uef.JSONWriter(json_file), uef.NDJSONWriter(ndjson_file),
+                                      uef.BinaryEventWriter(binary_file)])
+
+        def from_json():
+            with open(json_path, encoding='utf-8') as f:
+                loaded = [uef.EconomicEvent.from_dict(d) for d in json.load(f)['events']]
+            times = [e.timestamp_ms for e in loaded]
+            return loaded[bisect.bisect_left(times, probe_ms)]
+
+        def from_ndjson():
+            with open(ndjson_path, encoding='utf-8') as f:
+                return next(e for e in uef.JSONGenerator.iter_ndjson(f) if e.timestamp_ms >= probe_ms)
+
+        def from_binary():
+            with uef.EventFile(binary_path) as f:
+                return f.next_event(probe_ms)
+
+        assert from_json() == from_ndjson() == from_binary()
+        sizes = {path: os.path.getsize(path) for path in (json_path, ndjson_path, binary_path)}
+        print(f"\n{len(events)} events: " + ', '.join(
+            f"{os.path.basename(path)} {size / 1024:.0f} KiB" for path, size in sizes.items()))
+        report("Load and find next event", {
+            'json.load + from_dict': measure(from_json, repeat=3),
+            'NDJSON scan to first match': measure(from_ndjson, repeat=3),
+            'EventFile (mmap + bisect)': measure(from_binary),
+        })
+
+
+# Rough Pine tokenizer: comments, string literals, identifiers, numbers, operators
+_PINE_TOKEN = re.compile(r'//[^\n]*|"(?:\\.|[^"\\])*"|[A-Za-z_][\w.]*|\d+(?:\.\d+)?|[^\s\w]')
+
+
+def pine_tokens(script: str) -> int:
+    """Approximate compiler token count (comments excluded)"""
+    return sum(1 for token in _PINE_TOKEN.findall(script) if not token.startswith('//'))
+
+
+def bench_pine_encoding(years: int = 2):
+    """Pine size per encoding: bytes, lines, tokens and generation time"""
+    start = datetime(2026, 1, 1, tzinfo=uef.UTC)
+    end = start.replace(year=start.year + years)
+    events = uef.EventDeduplicator().merge(uef.HardcodedFetcher().iter_events(start, end))
+
+    print(f"\n== Pine encodings ({len(events)} events) ==")
+    print(f"{'encoding':<14}{'bytes':>10}{'lines':>8}{'tokens':>10}{'time (ms)':>12}")
+    for encoding in uef.PINE_ENCODINGS:
+        script = uef.PineScriptGenerator.generate_pine_arrays(events, encoding)
+        seconds, _ = measure(lambda: uef.PineScriptGenerator.generate_pine_arrays(events, encoding), repeat=3)
+        print(f"{encoding:<14}{len(script.encode('utf-8')):>10}{len(script.splitlines()):>8}"
+              f"{pine_tokens(script):>10}{seconds * 1000:>12.2f}")
+
+
+BENCHMARKS = {
+    'html_parsing': bench_html_parsing,
+    'timezone_conversion': bench_timezone_conversion,
+    'event_memory': bench_event_memory,
+    'schedule_load': bench_schedule_load,
+    'streaming_pipeline': bench_streaming_pipeline,
+    'json_output': bench_json_output,
+    'binary_load': bench_binary_load,
+    'pine_encoding': bench_pine_encoding,
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('names', nargs='*', metavar='name',
+                            help=f"benchmarks to run (default: all): {', '.join(BENCHMARKS)}")
+    args = arg_parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        arg_parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name]()
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
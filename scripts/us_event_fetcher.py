@@ -2,25 +2,45 @@
 """
 US Economic Event Fetcher for TradingView
 Fetches high/medium impact US economic events from multiple free sources
-Outputs events.json and events.pine for TradingView Pine Script integration
+Outputs events.json and events.pine for TradingView Pine Script integration,
+plus events.ndjson (one event per line) for streaming consumers and
+events.bin (fixed-width records, memory-mappable) for bots
 
 Author: Claude (Anthropic)
 Version: 1.0
 Python: 3.8+
-Requirements: requests, beautifulsoup4, lxml, pytz, dateutil
+Requirements: requests, beautifulsoup4, lxml, pytz, dateutil (optional: orjson)
 """
 
 import json
+import sys
+import os
 import re
+import hashlib
+import functools
+import heapq
+import shutil
+import tempfile
+import io
+import calendar
+import math
+import bisect
+import mmap
+import struct
+from array import array
+from itertools import compress
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timedelta, date
+from typing import List, Dict, Optional, Callable, Tuple, Iterable, Iterator, Union, NamedTuple, TextIO
 import pytz
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dateutil import parser as date_parser
 import logging
 from urllib.parse import urljoin
 import time
+import threading
+from concurrent.futures import Future, as_completed, TimeoutError as FuturesTimeoutError
 
 # ============================================================================
 # CONFIGURATION
@@ -30,6 +50,10 @@ import time
 UTC = pytz.UTC
 BKK = pytz.timezone('Asia/Bangkok')
 US_EASTERN = pytz.timezone('US/Eastern')
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+EPOCH_ORDINAL = EPOCH_UTC.toordinal()
+MS_PER_DAY = 86_400_000
+_ONE_MS = timedelta(milliseconds=1)
 
 # Logging setup
 logging.basicConfig(
@@ -38,6 +62,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Source fetching: run all fetchers at once and give up on stragglers
+# after a global deadline (seconds, shared by every source); abandoned
+# fetchers run on daemon threads, so they do not delay exit either
+CONCURRENT_FETCH = True
+FETCH_DEADLINE_SECONDS = 30
+
+# HTTP client: one pooled session shared by every fetcher
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+HTTP_TIMEOUT_SECONDS = 10
+HTTP_POOL_CONNECTIONS = 8   # number of per-host pools kept alive
+HTTP_POOL_MAXSIZE = 4       # max keep-alive connections per host
+HTTP_MAX_RETRIES = 1
+
+# On-disk HTTP cache (conditional GET via ETag / Last-Modified), relative to
+# the working directory like the generated outputs. None disables it.
+HTTP_CACHE_DIR = os.path.join('.cache', 'http')
+
+# Parsed-event cache keyed by a hash of the raw response body, so a 200 with
+# byte-identical content skips the HTML parse. Oldest entries are evicted past
+# PARSED_CACHE_MAX_ENTRIES. Bump PARSED_CACHE_VERSION whenever parsing output
+# changes so stale parses are not reused.
+PARSED_CACHE_DIR = os.path.join('.cache', 'parsed')
+PARSED_CACHE_MAX_ENTRIES = 32
+PARSED_CACHE_VERSION = 5
+
+# HTML parsing: prefer the C-backed lxml parser and only materialize the
+# elements each fetcher reads (calendar rows / links) instead of the whole page
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+RESTRICTED_PARSING = True
+
+# Output window relative to run time: every output keeps events from
+# OUTPUT_LOOKBACK_DAYS before the run to OUTPUT_LOOKAHEAD_DAYS after it
+OUTPUT_LOOKBACK_DAYS = 7
+OUTPUT_LOOKAHEAD_DAYS = 365
+
+# Streaming output: event records are buffered in memory up to this size
+# before spilling to a temp file (headers need the final event count)
+OUTPUT_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+
+# Pine output encoding (same array names and types in every mode):
+#   'statements' - one array.set() per field, timestamp() evaluated at load
+#   'arrays'     - one array.from() literal per column, precomputed epoch-ms
+#   'strings'    - one delimited string per column, split at script load
+# Literals are wrapped PINE_VALUES_PER_LINE values to a line.
+PINE_ENCODINGS = ('statements', 'arrays', 'strings')
+PINE_ENCODING = 'arrays'
+PINE_VALUES_PER_LINE = 16
+PINE_DELIMITER = '|'
+
+# Append Pine helpers that binary-search event_times_utc (next / nearest event)
+PINE_LOOKUP_HELPERS = True
+
+# Pine libraries: with PINE_CHUNK_PERIOD set ('quarter' or 'year'), events are
+# also split into one importable library per period under PINE_DIR, plus an
+# index library mapping bar time to its chunk (None disables)
+PINE_CHUNK_PERIOD = 'quarter'
+PINE_DIR = 'pine'
+PINE_LIBRARY_PREFIX = 'us_events'
+
+# Pre-filtered Pine subsets (impact tiers and EVENT_CATEGORY_KEYWORDS
+# categories): 'arrays' adds event_index_<subset> arrays of row indices to
+# events.pine, 'files' writes PINE_DIR/events_<subset>.pine with the same
+# arrays and helpers as events.pine, None disables
+PINE_SUBSETS = ('high', 'medium', 'rates', 'inflation', 'labour', 'housing')
+PINE_SPLIT_MODE = 'files'
+
+# JSON output: encode with orjson when installed (several times faster than
+# the stdlib encoder); JSON_COMPACT drops indentation and spaces
+try:
+    import orjson
+except ImportError:
+    orjson = None
+FAST_JSON = orjson is not None
+JSON_COMPACT = False
+# Events per encoder call when streaming events.json (one list per batch)
+JSON_BATCH_SIZE = 512
+
+# Business-day calendar span (years, inclusive); queries outside it extend it
+BUSINESS_CALENDAR_START_YEAR = 2000
+BUSINESS_CALENDAR_END_YEAR = 2050
+
 # Event impact levels and keywords
 HIGH_IMPACT_KEYWORDS = [
     'FOMC', 'Federal Reserve', 'Fed', 'Interest Rate Decision',
@@ -92,39 +201,275 @@ SPECIAL_EVENTS = [
     'Market Volatility', 'Flash Crash', 'Black Swan'
 ]
 
+# Event categories, in priority order: an event gets the first category with
+# a keyword occurring in its name (case-insensitive), or none
+EVENT_CATEGORY_KEYWORDS = {
+    'rates': ['FOMC', 'Federal Reserve', 'Federal Funds', 'Interest Rate', 'Fed Chair', 'Beige Book'],
+    'inflation': ['CPI', 'Consumer Price', 'PPI', 'Producer Price', 'PCE', 'Personal Consumption',
+                  'Inflation', 'Import Prices', 'Export Prices'],
+    'labour': ['NFP', 'Non-Farm', 'Nonfarm', 'Payroll', 'Employment', 'Jobless Claims', 'Unemployment',
+               'Jobs Report', 'Average Hourly Earnings', 'Labor Force', 'JOLTS'],
+    'housing': ['Housing Starts', 'Building Permits', 'Home Sales', 'Mortgage', 'Construction Spending',
+                'House Price', 'Home Price', 'NAHB'],
+}
+
+# Cross-source name aliases used by deduplication. Each canonical name lists
+# the spellings different sources use; matching is on the normalized name
+# (lowercase, no parentheticals, period suffixes like m/m split off).
+EVENT_ALIASES = {
+    'cpi': ['CPI', 'CPI Release', 'Consumer Price Index', 'Inflation Rate'],
+    'core cpi': ['Core CPI', 'Core Consumer Price Index', 'Core Inflation Rate'],
+    'ppi': ['PPI', 'PPI Release', 'Producer Price Index'],
+    'core ppi': ['Core PPI', 'Core Producer Price Index'],
+    'nfp': ['NFP', 'Employment Report', 'Non-Farm Payroll', 'Non-Farm Payrolls',
+            'Nonfarm Payrolls', 'Non-Farm Employment Change', 'Jobs Report'],
+    'jobless claims': ['Jobless Claims', 'Initial Jobless Claims', 'Unemployment Claims'],
+    'retail sales': ['Retail Sales', 'Advance Retail Sales'],
+    'ism manufacturing pmi': ['ISM Manufacturing', 'ISM Manufacturing PMI'],
+    'ism services pmi': ['ISM Services', 'ISM Services PMI', 'ISM Non-Manufacturing PMI'],
+    'pce price index': ['PCE', 'PCE Price Index', 'Personal Consumption Expenditures'],
+    'core pce price index': ['Core PCE', 'Core PCE Price Index'],
+    'gdp': ['GDP', 'Gross Domestic Product', 'Advance GDP', 'Prelim GDP', 'Final GDP'],
+    'fomc interest rate decision': ['FOMC Interest Rate Decision', 'Fed Interest Rate Decision',
+                                    'Federal Funds Rate', 'Interest Rate Decision'],
+    'mba mortgage applications': ['MBA Mortgage Applications', 'MBA Purchase Index'],
+}
+
+# Events with the same canonical name closer together than this are duplicates
+DEDUP_TOLERANCE_MINUTES = 60
+
+# When duplicates are merged, each field is taken from the highest-priority
+# source that has a value for it. Earlier = higher priority; unlisted sources
+# rank below every listed one.
+SOURCE_PRIORITY = [
+    'Forex Factory',
+    'Federal Reserve',
+    'Federal Reserve (Hardcoded)',
+    'Hardcoded Schedule',
+]
+
+# ============================================================================
+# TIMEZONE CONVERSION
+# ============================================================================
+
+class ZoneConverter:
+    """Local wall time <-> UTC for one pytz zone, with UTC offsets cached per date
+    
+    pytz zones must go through localize(); replace(tzinfo=...) silently picks
+    the zone's LMT offset. Localizing is also slow, so the offset for each local
+    date is computed once and reused. Dates on which the offset changes (DST
+    transitions) are not cached and always go through localize().
+    """
+    
+    def __init__(self, zone):
+        self.zone = zone
+        self._offsets: Dict[date, Optional[timedelta]] = {}
+        self._offset_ms: Dict[int, Optional[int]] = {}  # same cache keyed by ordinal, in ms
+    
+    def _offset_for(self, day: date) -> Optional[timedelta]:
+        try:
+            return self._offsets[day]
+        except KeyError:
+            pass
+        start = self.zone.localize(datetime(day.year, day.month, day.day)).utcoffset()
+        end = self.zone.localize(datetime(day.year, day.month, day.day, 23, 59)).utcoffset()
+        offset = start if start == end else None
+        self._offsets[day] = offset
+        return offset
+    
+    def to_utc(self, local: datetime) -> datetime:
+        """Convert a naive local wall time to an aware UTC datetime"""
+        offset = self._offset_for(local.date())
+        if offset is None:
+            return self.zone.localize(local).astimezone(UTC)
+        return (local - offset).replace(tzinfo=UTC)
+    
+    def to_utc_many(self, local_times: List[datetime]) -> List[datetime]:
+        """Bulk to_utc(); one offset lookup per distinct date"""
+        return [self.to_utc(local) for local in local_times]
+    
+    def utc_ms_for_dates(self, ordinals: Iterable[int], ms_of_day: int) -> array:
+        """UTC epoch ms of one local wall-clock time on many dates (as ordinals)
+        
+        Pure integer arithmetic per date; no datetime objects except on DST
+        transition days.
+        """
+        offsets = self._offset_ms
+        result = array('q')
+        append = result.append
+        for ordinal in ordinals:
+            try:
+                offset = offsets[ordinal]
+            except KeyError:
+                offset = self._offset_for(date.fromordinal(ordinal))
+                offset = offsets[ordinal] = None if offset is None else offset // _ONE_MS
+            if offset is None:
+                local = datetime.fromordinal(ordinal) + timedelta(milliseconds=ms_of_day)
+                append(to_epoch_ms(self.to_utc(local)))
+            else:
+                append((ordinal - EPOCH_ORDINAL) * MS_PER_DAY + ms_of_day - offset)
+        return result
+
+
+def to_epoch_ms(dt: datetime) -> int:
+    """Aware (or naive UTC) datetime -> integer UTC epoch milliseconds"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return (dt - EPOCH_UTC) // _ONE_MS
+
+
+def utc_now_ms() -> int:
+    """Current time as UTC epoch milliseconds"""
+    return to_epoch_ms(datetime.now(UTC))
+
+
+_zone_converters: Dict[str, ZoneConverter] = {}
+
+
+def zone_converter(zone) -> ZoneConverter:
+    """Shared converter for a pytz zone (offset caches are per zone)"""
+    converter = _zone_converters.get(zone.zone)
+    if converter is None:
+        converter = _zone_converters.setdefault(zone.zone, ZoneConverter(zone))
+    return converter
+
+
+EASTERN = zone_converter(US_EASTERN)
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
 class EconomicEvent:
-    """Represents a single economic event"""
+    """Represents a single economic event
+    
+    Immutable and slotted: the time is stored as integer UTC epoch milliseconds
+    and name/impact/source are interned, since calendars can hold many events.
+    Equality, hashing and ordering use (timestamp_ms, name, impact, source).
+    """
+    
+    __slots__ = ('name', 'timestamp_ms', 'impact', 'forecast', 'previous', 'actual', 'source',
+                 '_contributors')
+    FIELDS = ('name', 'timestamp_ms', 'impact', 'forecast', 'previous', 'actual', 'source', 'contributors')
     
     def __init__(self, name: str, event_time_utc: datetime, 
                  impact: str, forecast: Optional[str] = None, 
                  previous: Optional[str] = None, actual: Optional[str] = None,
-                 source: str = 'Unknown'):
-        self.name = name
-        self.event_time_utc = event_time_utc.replace(tzinfo=UTC) if event_time_utc.tzinfo is None else event_time_utc.astimezone(UTC)
-        self.impact = impact  # 'High', 'Medium', 'Low'
-        self.forecast = forecast
-        self.previous = previous
-        self.actual = actual
-        self.source = source
+                 source: str = 'Unknown', contributors: Optional[Tuple[str, ...]] = None):
+        self._set_fields(name, to_epoch_ms(event_time_utc), impact, forecast, previous, actual,
+                         source, contributors)
+    
+    @classmethod
+    def from_timestamp_ms(cls, name: str, timestamp_ms: int, impact: str,
+                          forecast: Optional[str] = None, previous: Optional[str] = None,
+                          actual: Optional[str] = None, source: str = 'Unknown',
+                          contributors: Optional[Tuple[str, ...]] = None) -> 'EconomicEvent':
+        """Build an event straight from UTC epoch milliseconds (no datetime needed)"""
+        event = cls.__new__(cls)
+        event._set_fields(name, timestamp_ms, impact, forecast, previous, actual, source, contributors)
+        return event
+    
+    def _set_fields(self, name, timestamp_ms, impact, forecast, previous, actual, source, contributors):
+        setattr_ = object.__setattr__
+        setattr_(self, 'name', sys.intern(name))
+        setattr_(self, 'timestamp_ms', int(timestamp_ms))
+        setattr_(self, 'impact', sys.intern(impact))  # 'High', 'Medium', 'Low'
+        setattr_(self, 'forecast', forecast)
+        setattr_(self, 'previous', previous)
+        setattr_(self, 'actual', actual)
+        setattr_(self, 'source', sys.intern(source))
+        # Only merged events keep a tuple; a lone source is implied (see contributors)
+        if contributors and tuple(contributors) != (self.source,):
+            setattr_(self, '_contributors', tuple(sys.intern(c) for c in contributors))
+        else:
+            setattr_(self, '_contributors', None)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable; use replace()")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+    
+    def __reduce__(self):
+        return (EconomicEvent.from_timestamp_ms,
+                (self.name, self.timestamp_ms, self.impact, self.forecast,
+                 self.previous, self.actual, self.source, self._contributors))
+    
+    def replace(self, **changes) -> 'EconomicEvent':
+        """Copy of this event with some fields changed"""
+        fields = {field: getattr(self, field) for field in self.FIELDS}
+        fields['contributors'] = self._contributors
+        if 'event_time_utc' in changes:
+            fields['timestamp_ms'] = to_epoch_ms(changes.pop('event_time_utc'))
+        fields.update(changes)
+        return EconomicEvent.from_timestamp_ms(**fields)
+    
+    @property
+    def contributors(self) -> Tuple[str, ...]:
+        """Every source merged into this event (just `source` unless merged)"""
+        return self._contributors or (self.source,)
+    
+    @property
+    def event_time_utc(self) -> datetime:
+        """Event time as an aware UTC datetime (built on demand)"""
+        return EPOCH_UTC + timedelta(milliseconds=self.timestamp_ms)
+    
+    @property
+    def key(self) -> Tuple[int, str, str, str]:
+        """Identity used for equality, hashing and ordering"""
+        return (self.timestamp_ms, self.name, self.impact, self.source)
+    
+    def __eq__(self, other):
+        if not isinstance(other, EconomicEvent):
+            return NotImplemented
+        return self.key == other.key
+    
+    def __hash__(self):
+        return hash(self.key)
+    
+    def __lt__(self, other: 'EconomicEvent') -> bool:
+        return self.key < other.key
+    
+    def __le__(self, other: 'EconomicEvent') -> bool:
+        return self.key <= other.key
+    
+    def __gt__(self, other: 'EconomicEvent') -> bool:
+        return self.key > other.key
+    
+    def __ge__(self, other: 'EconomicEvent') -> bool:
+        return self.key >= other.key
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
+        event_time_utc = self.event_time_utc
         return {
             'name': self.name,
-            'time_utc': self.event_time_utc.isoformat(),
-            'time_bkk': self.event_time_utc.astimezone(BKK).isoformat(),
+            'time_utc': event_time_utc.isoformat(),
+            'time_bkk': event_time_utc.astimezone(BKK).isoformat(),
             'impact': self.impact,
             'forecast': self.forecast,
             'previous': self.previous,
             'actual': self.actual,
             'source': self.source,
-            'timestamp_utc_ms': int(self.event_time_utc.timestamp() * 1000)
+            'contributors': list(self.contributors),
+            'timestamp_utc_ms': self.timestamp_ms
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'EconomicEvent':
+        """Rebuild an event from its to_dict() form"""
+        return cls.from_timestamp_ms(
+            name=data['name'],
+            timestamp_ms=data['timestamp_utc_ms'],
+            impact=data['impact'],
+            forecast=data.get('forecast'),
+            previous=data.get('previous'),
+            actual=data.get('actual'),
+            source=data.get('source', 'Unknown'),
+            contributors=tuple(data.get('contributors') or ())
+        )
+    
     def to_pine_script(self) -> str:
         """Convert to Pine Script timestamp"""
         dt = self.event_time_utc
@@ -134,396 +479,1559 @@ class EconomicEvent:
         return f"<Event {self.name} @ {self.event_time_utc} ({self.impact})>"
 
 
-# ============================================================================
-# FETCHER CLASSES
-# ============================================================================
-
-class InvestingComFetcher:
-    """Fetch events from Investing.com Economic Calendar"""
+class _StringPool:
+    """Append-only string table mapping strings <-> small integer codes"""
     
-    BASE_URL = "https://www.investing.com/economic-calendar/"
+    __slots__ = ('strings', 'codes')
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.strings: List[str] = []
+        self.codes: Dict[str, int] = {}
     
-    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
-        """Fetch events from Investing.com"""
-        events = []
-        try:
-            logger.info("Fetching from Investing.com...")
-            
-            # Note: Investing.com requires specific headers and may have anti-scraping
-            # This is a simplified approach; for production, consider using their calendar API
-            # or a dedicated library like investpy
-            
-            # Fallback: Provide instruction to use alternative sources
-            logger.warning("Investing.com requires advanced scraping. Using alternative sources only.")
-            
-        except Exception as e:
-            logger.error(f"Investing.com fetch failed: {e}")
-        
-        return events
+    def code(self, value: Optional[str]) -> int:
+        """Code for value, adding it if new (None -> -1)"""
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.strings)
+            self.strings.append(sys.intern(value))
+        return code
+    
+    def get(self, code: int) -> Optional[str]:
+        return None if code < 0 else self.strings[code]
 
 
-class ForexFactoryFetcher:
-    """Fetch events from Forex Factory Economic Calendar"""
+class EventTable:
+    """Columnar event store backed by array buffers
     
-    BASE_URL = "https://www.forexfactory.com/calendar.php"
+    timestamps holds int64 UTC epoch-ms; every string column holds int32 codes
+    into a string pool shared by the tables derived from this one (-1 = None).
+    Filtering, sorting and time-window slicing work on the buffers and only
+    build EconomicEvent objects when rows are read back. Without NumPy these
+    are still per-row Python loops (map/compress over array); the gain is
+    memory and skipped object construction, not vectorized arithmetic.
+    main() collects the merged stream into a table before writing outputs.
+    """
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+    STRING_COLUMNS = ('names', 'impacts', 'sources', 'forecasts', 'previous', 'actuals', 'contributors')
+    _CONTRIBUTOR_SEP = '\x1f'
     
-    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
-        """Fetch events from Forex Factory"""
-        events = []
-        try:
-            logger.info("Fetching from Forex Factory...")
-            
-            # Construct URL with parameters
-            params = {
-                'month': 'all',
-                'country': 'us'  # US events only
-            }
-            
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Forex Factory table structure: <table> with rows containing event data
-            rows = soup.find_all('tr', {'class': 'calendar__row'})
-            
-            if not rows:
-                # Try alternative selector
-                rows = soup.find_all('tr')
-            
-            for row in rows:
-                try:
-                    # Extract event data from row
-                    cells = row.find_all('td')
-                    if len(cells) < 5:
-                        continue
-                    
-                    # Typical structure: Date | Time | Impact | Event | Forecast | Previous | Actual
-                    event_name = cells[2].text.strip() if len(cells) > 2 else ''
-                    impact_str = cells[1].text.strip() if len(cells) > 1 else ''
-                    forecast = cells[4].text.strip() if len(cells) > 4 else None
-                    previous = cells[5].text.strip() if len(cells) > 5 else None
-                    
-                    # Skip if not high/medium impact
-                    if not self._is_high_medium_impact(event_name):
-                        continue
-                    
-                    # Parse time (Forex Factory uses specific format)
-                    time_str = cells[0].text.strip() if len(cells) > 0 else ''
-                    event_time = self._parse_time(time_str)
-                    
-                    if event_time and event_time > datetime.now(UTC):
-                        impact = 'High' if 'High' in impact_str else 'Medium'
-                        event = EconomicEvent(
-                            name=event_name,
-                            event_time_utc=event_time,
-                            impact=impact,
-                            forecast=forecast if forecast and forecast.lower() != 'n/a' else None,
-                            previous=previous if previous and previous.lower() != 'n/a' else None,
-                            source='Forex Factory'
-                        )
-                        events.append(event)
-                
-                except Exception as e:
-                    logger.debug(f"Error parsing Forex Factory row: {e}")
-                    continue
-            
-            logger.info(f"Forex Factory: Found {len(events)} events")
+    def __init__(self, pool: Optional[_StringPool] = None):
+        self.pool = pool or _StringPool()
+        self.timestamps = array('q')
+        for column in self.STRING_COLUMNS:
+            setattr(self, column, array('i'))
+        self.is_sorted = True
+    
+    @classmethod
+    def from_events(cls, events: Iterable[EconomicEvent]) -> 'EventTable':
+        """Build a table from EconomicEvent objects"""
+        if isinstance(events, EventTable):
+            return events
         
-        except Exception as e:
-            logger.error(f"Forex Factory fetch failed: {e}")
+        table = cls()
+        code = table.pool.code
+        timestamps = table.timestamps
+        names, impacts, sources = table.names, table.impacts, table.sources
+        forecasts, previous, actuals = table.forecasts, table.previous, table.actuals
+        contributors, sep = table.contributors, cls._CONTRIBUTOR_SEP
         
-        return events
+        last_ms = None
+        is_sorted = True
+        for event in events:
+            ms = event.timestamp_ms
+            if last_ms is not None and ms < last_ms:
+                is_sorted = False
+            last_ms = ms
+            timestamps.append(ms)
+            names.append(code(event.name))
+            impacts.append(code(event.impact))
+            sources.append(code(event.source))
+            forecasts.append(code(event.forecast))
+            previous.append(code(event.previous))
+            actuals.append(code(event.actual))
+            contributors.append(code(sep.join(event.contributors)))
+        table.is_sorted = is_sorted
+        return table
     
-    def _is_high_medium_impact(self, event_name: str) -> bool:
-        """Check if event is high or medium impact"""
-        event_lower = event_name.lower()
-        for keyword in HIGH_IMPACT_KEYWORDS + MEDIUM_IMPACT_KEYWORDS:
-            if keyword.lower() in event_lower:
-                return True
-        return False
+    def to_events(self) -> List[EconomicEvent]:
+        """Materialize every row as an EconomicEvent"""
+        return list(self)
     
-    def _parse_time(self, time_str: str) -> Optional[datetime]:
-        """Parse time string from Forex Factory"""
-        try:
-            # Forex Factory uses format like "2025-01-15 15:30" or "Jan 15, 2025 3:30 PM"
-            return date_parser.parse(time_str, ignoretz=True).replace(tzinfo=US_EASTERN)
-        except:
-            return None
-
-
-class FedCalendarFetcher:
-    """Fetch FOMC events from Federal Reserve calendar"""
+    def __len__(self) -> int:
+        return len(self.timestamps)
     
-    BASE_URL = "https://www.federalreserve.gov/newsevents.htm"
+    def _event(self, i: int) -> EconomicEvent:
+        get = self.pool.get
+        return EconomicEvent.from_timestamp_ms(
+            name=get(self.names[i]),
+            timestamp_ms=self.timestamps[i],
+            impact=get(self.impacts[i]),
+            forecast=get(self.forecasts[i]),
+            previous=get(self.previous[i]),
+            actual=get(self.actuals[i]),
+            source=get(self.sources[i]),
+            contributors=tuple(get(self.contributors[i]).split(self._CONTRIBUTOR_SEP))
+        )
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+    def __iter__(self) -> Iterator[EconomicEvent]:
+        for i in range(len(self)):
+            yield self._event(i)
     
-    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
-        """Fetch FOMC events from Federal Reserve"""
-        events = []
-        try:
-            logger.info("Fetching FOMC events from Federal Reserve...")
-            
-            # FOMC meeting calendar
-            fomc_url = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
-            response = self.session.get(fomc_url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for FOMC meeting dates (typically 2:00 PM ET on meeting days)
-            # Pattern: Look for text containing "FOMC" and dates
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                text = link.text.strip()
-                if 'FOMC' in text or 'Federal Open' in text:
-                    # Try to extract date from link text or nearby content
-                    try:
-                        # FOMC meetings are typically at 2:00 PM ET on announced dates
-                        # Default: 2:00 PM ET on Wednesday (press release time)
-                        date_match = re.search(r'(\w+)\s+(\d+),?\s+(\d{4})', text)
-                        if date_match:
-                            month_str, day_str, year_str = date_match.groups()
-                            event_date_str = f"{month_str} {day_str}, {year_str} 2:00 PM"
-                            event_time = date_parser.parse(event_date_str)
-                            event_time = US_EASTERN.localize(event_time) if event_time.tzinfo is None else event_time
-                            
-                            if event_time > datetime.now(UTC):
-                                # FOMC events
-                                for event_type in ['Interest Rate Decision', 'Economic Projections', 'Press Conference']:
-                                    time_offset = timedelta(minutes=30) if 'Press' in event_type else timedelta(0)
-                                    event = EconomicEvent(
-                                        name=f"FOMC {event_type}",
-                                        event_time_utc=event_time + time_offset,
-                                        impact='High',
-                                        source='Federal Reserve'
-                                    )
-                                    events.append(event)
-                    except Exception as e:
-                        logger.debug(f"Error parsing FOMC date: {e}")
-                        continue
-            
-            logger.info(f"Federal Reserve: Found {len(events)} FOMC events")
-        
-        except Exception as e:
-            logger.error(f"Federal Reserve fetch failed: {e}")
-        
-        return events
+    def __getitem__(self, index: Union[int, slice]) -> Union[EconomicEvent, 'EventTable']:
+        if isinstance(index, slice):
+            return self._slice(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('EventTable index out of range')
+        return self._event(index)
+    
+    def _slice(self, index: slice) -> 'EventTable':
+        table = EventTable(self.pool)
+        table.timestamps = self.timestamps[index]
+        for column in self.STRING_COLUMNS:
+            setattr(table, column, getattr(self, column)[index])
+        table.is_sorted = self.is_sorted and index.step in (None, 1)
+        return table
+    
+    def take(self, indices: Iterable[int]) -> 'EventTable':
+        """New table with the given rows, in the given order"""
+        indices = indices if isinstance(indices, (list, array)) else list(indices)
+        table = EventTable(self.pool)
+        table.timestamps = array('q', map(self.timestamps.__getitem__, indices))
+        for column in self.STRING_COLUMNS:
+            setattr(table, column, array('i', map(getattr(self, column).__getitem__, indices)))
+        table.is_sorted = False
+        return table
+    
+    def filter_impact(self, *impacts: str) -> 'EventTable':
+        """Rows whose impact is one of impacts (order preserved)"""
+        wanted = {self.pool.codes[i] for i in impacts if i in self.pool.codes}
+        keep = list(compress(range(len(self)), map(wanted.__contains__, self.impacts)))
+        table = self.take(keep)
+        table.is_sorted = self.is_sorted
+        return table
+    
+    def sort_by_time(self) -> 'EventTable':
+        """Rows in time order (stable, so ties keep their current order)"""
+        if self.is_sorted:
+            return self
+        table = self.take(sorted(range(len(self)), key=self.timestamps.__getitem__))
+        table.is_sorted = True
+        return table
+    
+    def between(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> 'EventTable':
+        """Rows with start_ms <= timestamp < end_ms, found by binary search"""
+        table = self.sort_by_time()
+        lo = 0 if start_ms is None else bisect.bisect_left(table.timestamps, start_ms)
+        hi = len(table) if end_ms is None else bisect.bisect_left(table.timestamps, end_ms)
+        return table[lo:hi]
 
 
-class HardcodedFetcher:
-    """Fallback hardcoded events for 2026 (will be updated periodically)"""
+# Anything the aggregator and output generators accept: a plain list or a table
+EventSequence = Union[List[EconomicEvent], EventTable]
+
+
+# ============================================================================
+# KEYWORD CLASSIFICATION
+# ============================================================================
+
+class KeywordClassifier:
+    """Case-insensitive substring classifier compiled once into a single regex
     
-    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
-        """Return hardcoded 2026 US economic events"""
-        events = []
-        
-        # ===== 2026 FOMC MEETINGS (Known Schedule) =====
-        fomc_dates_2026 = [
-            ('2026-01-27', 19, 0),   # Wed, 2:00 PM ET
-            ('2026-03-17', 19, 0),   # Tue, 2:00 PM ET
-            ('2026-05-04', 19, 0),   # Tue, 2:00 PM ET
-            ('2026-06-16', 19, 0),   # Tue, 2:00 PM ET
-            ('2026-07-28', 19, 0),   # Tue, 2:00 PM ET
-            ('2026-09-16', 19, 0),   # Wed, 2:00 PM ET
-            ('2026-11-03', 19, 0),   # Tue, 2:00 PM ET
-            ('2026-12-15', 19, 0),   # Tue, 2:00 PM ET
-        ]
-        
-        for date_str, hour_et, minute in fomc_dates_2026:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            event_time = US_EASTERN.localize(datetime(date_obj.year, date_obj.month, date_obj.day, hour_et, minute))
-            
-            for event_type in ['Interest Rate Decision', 'Economic Projections']:
-                event = EconomicEvent(
-                    name=f"FOMC {event_type}",
-                    event_time_utc=event_time,
-                    impact='High',
-                    source='Federal Reserve (Hardcoded)'
-                )
-                events.append(event)
-            
-            # Press Conference 30 mins after
-            press_conf_time = event_time + timedelta(minutes=30)
-            event = EconomicEvent(
-                name="FOMC Press Conference",
-                event_time_utc=press_conf_time,
-                impact='High',
-                source='Federal Reserve (Hardcoded)'
-            )
-            events.append(event)
-        
-        # ===== 2026 MONTHLY ECONOMIC EVENTS (Typical Schedule) =====
-        # These repeat monthly, so we generate them for each month
+    Tiers are given in priority order; classify() returns the highest-priority
+    tier with any keyword occurring in the text, in one scan.
+    """
+    
+    def __init__(self, tiers: List[Tuple[str, List[str]]]):
+        self.tiers = [tier for tier, _ in tiers]
         
-        monthly_events = [
-            # Week 1
-            ('Employment Report (NFP)', 7, 12, 30, 'High', 'First Friday at 8:30 AM ET'),
-            ('Jobless Claims', 4, 12, 30, 'High', 'Weekly Thursday at 8:30 AM ET'),
-            
-            # Week 2
-            ('CPI Release', 12, 12, 30, 'High', 'Mid-month, typically 2nd week'),
-            ('PPI Release', 13, 12, 30, 'High', 'Mid-month, typically 2nd week'),
-            ('Retail Sales', 13, 12, 30, 'High', 'Mid-month release'),
-            ('ISM Manufacturing PMI', 1, 12, 0, 'High', 'First business day of month'),
-            
-            # Week 3-4
-            ('ISM Services PMI', 3, 12, 0, 'Medium', 'Third business day of month'),
-            ('Durable Goods Orders', 25, 12, 30, 'Medium', 'Last Friday of month'),
-            ('Personal Income', 27, 12, 30, 'Medium', 'End of month'),
-            ('Personal Spending', 27, 13, 30, 'Medium', 'End of month'),
-            ('PCE Price Index', 27, 12, 30, 'High', 'End of month'),
-            
-            # Housing
-            ('Housing Starts', 18, 12, 30, 'High', 'Mid-month'),
-            ('Building Permits', 18, 12, 30, 'Medium', 'Mid-month'),
-            ('Existing Home Sales', 25, 14, 0, 'High', 'Last week of month'),
-            ('New Home Sales', 28, 14, 0, 'Medium', 'End of month'),
-        ]
+        rank: Dict[str, int] = {}
+        for index, (_, keywords) in enumerate(tiers):
+            for keyword in keywords:
+                key = keyword.lower()
+                rank[key] = min(rank.get(key, index), index)
         
-        for month in range(1, 13):
-            year = 2026
-            
-            # Skip months in the past
-            if datetime.now(UTC) > datetime(year, month, 28, 23, 59, tzinfo=UTC):
-                continue
-            
-            for event_name, day, hour_et, minute, impact, note in monthly_events:
-                try:
-                    # Handle events that might not exist in certain months
-                    if day > 28:
-                        # Adjust for months with fewer days
-                        import calendar
-                        last_day = calendar.monthrange(year, month)[1]
-                        day = min(day, last_day)
-                    
-                    event_time = US_EASTERN.localize(datetime(year, month, day, hour_et, minute))
-                    
-                    # Skip if in the past
-                    if event_time < datetime.now(UTC):
-                        continue
-                    
-                    event = EconomicEvent(
-                        name=event_name,
-                        event_time_utc=event_time,
-                        impact=impact,
-                        source='Hardcoded Schedule'
-                    )
-                    events.append(event)
-                
-                except ValueError:
-                    # Day doesn't exist in this month
-                    continue
+        # A keyword inherits the best tier of any keyword it contains
+        # (e.g. 'Core PCE Price Index' contains 'PCE'), so only the longest
+        # match starting at each position needs to be looked at
+        self._rank = {key: min(r for other, r in rank.items() if other in key) for key in rank}
         
-        logger.info(f"Hardcoded Fetcher: Generated {len(events)} events")
-        return events
-
-
-class TrumpAnnouncementMonitor:
-    """Monitor for Trump announcements and special events"""
+        # Longest-first alternation inside a lookahead: one match per start position
+        alternation = '|'.join(re.escape(k) for k in sorted(self._rank, key=len, reverse=True))
+        self._pattern = re.compile(f"(?=({alternation}))", re.IGNORECASE)
     
-    def __init__(self):
-        self.session = requests.Session()
+    def classify(self, text: str) -> Optional[str]:
+        """Highest-priority tier matched in text, or None"""
+        best = None
+        for match in self._pattern.finditer(text):
+            rank = self._rank[match.group(1).lower()]
+            if best is None or rank < best:
+                best = rank
+                if best == 0:
+                    break
+        return None if best is None else self.tiers[best]
     
-    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
-        """Fetch Trump-related announcements"""
-        events = []
-        try:
-            logger.info("Monitoring for Trump announcements...")
-            # This would require monitoring news sources or Twitter/X
-            # For now, skip automated monitoring and rely on manual input
-            logger.info("Trump announcements: Manual monitoring recommended")
-        except Exception as e:
-            logger.error(f"Trump announcement fetch failed: {e}")
-        
-        return events
+    def matches(self, text: str) -> bool:
+        """True if any keyword occurs in text"""
+        return self._pattern.search(text) is not None
+
+
+IMPACT_CLASSIFIER = KeywordClassifier([
+    ('High', HIGH_IMPACT_KEYWORDS),
+    ('Medium', MEDIUM_IMPACT_KEYWORDS),
+])
+SPECIAL_EVENT_CLASSIFIER = KeywordClassifier([('Special', SPECIAL_EVENTS)])
+CATEGORY_CLASSIFIER = KeywordClassifier(list(EVENT_CATEGORY_KEYWORDS.items()))
+
+
+@functools.lru_cache(maxsize=1024)
+def event_category(name: str) -> Optional[str]:
+    """Category of an event name (see EVENT_CATEGORY_KEYWORDS), or None"""
+    return CATEGORY_CLASSIFIER.classify(name)
 
 
 # ============================================================================
-# EVENT AGGREGATOR
+# TIME PARSING
 # ============================================================================
 
-class EventAggregator:
-    """Aggregate events from multiple sources and deduplicate"""
-    
-    def __init__(self):
-        self.fetchers = [
-            ForexFactoryFetcher(),
-            FedCalendarFetcher(),
-            HardcodedFetcher(),
-        ]
+_MONTHS = {name: i for i, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+
+# Known Forex Factory formats, tried in order before falling back to dateutil
+_ISO_TIME_RE = re.compile(
+    r'^(\d{4})-(\d{1,2})-(\d{1,2})(?:[ T](\d{1,2}):(\d{2})(?::(\d{2}))?)?$')
+_MONTH_NAME_TIME_RE = re.compile(
+    r'^(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+    r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?\s+(\d{1,2}),?\s+(\d{4})'
+    r'(?:\s+(\d{1,2}):(\d{2})\s*([AaPp][Mm])?)?$', re.IGNORECASE)
+_US_SLASH_TIME_RE = re.compile(
+    r'^(\d{1,2})/(\d{1,2})/(\d{4})(?:\s+(\d{1,2}):(\d{2})\s*([AaPp][Mm])?)?$')
+
+
+def _clock(hour: Optional[str], minute: Optional[str], meridiem: Optional[str]) -> Tuple[int, int]:
+    """Convert regex clock groups to 24h (hour, minute)"""
+    if hour is None:
+        return 0, 0
+    h = int(hour)
+    if meridiem:
+        if h > 12:
+            raise ValueError(f"invalid 12-hour clock value: {hour}")
+        h = h % 12 + (12 if meridiem.lower() == 'pm' else 0)
+    return h, int(minute)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_calendar_time(time_str: str) -> Optional[datetime]:
+    """Parse a calendar time string into a naive datetime (memoized)
     
-    def fetch_all(self, days_ahead: int = 365) -> List[EconomicEvent]:
-        """Fetch events from all sources and deduplicate"""
-        all_events = []
-        
-        for fetcher in self.fetchers:
-            try:
-                events = fetcher.fetch(days_ahead)
-                all_events.extend(events)
-            except Exception as e:
-                logger.error(f"Fetcher {fetcher.__class__.__name__} failed: {e}")
-        
-        # Deduplicate
-        seen = set()
-        unique_events = []
+    Calendar pages repeat the same strings across many rows, so results are
+    cached. Known formats take a precompiled regex path; anything else goes
+    through dateutil. Returns None if the string can't be parsed.
+    """
+    text = time_str.strip()
+    try:
+        match = _ISO_TIME_RE.match(text)
+        if match:
+            year, month, day, hour, minute, second = match.groups()
+            return datetime(int(year), int(month), int(day),
+                            int(hour or 0), int(minute or 0), int(second or 0))
         
-        for event in all_events:
-            # Create key from event name and time (within 1 minute tolerance)
-            key = (event.name, event.event_time_utc.replace(second=0, microsecond=0))
-            
-            if key not in seen:
-                seen.add(key)
-                unique_events.append(event)
+        match = _MONTH_NAME_TIME_RE.match(text)
+        if match:
+            month_name, day, year, hour, minute, meridiem = match.groups()
+            h, m = _clock(hour, minute, meridiem)
+            return datetime(int(year), _MONTHS[month_name[:3].lower()], int(day), h, m)
         
-        # Sort by time
-        unique_events.sort(key=lambda e: e.event_time_utc)
+        match = _US_SLASH_TIME_RE.match(text)
+        if match:
+            month, day, year, hour, minute, meridiem = match.groups()
+            h, m = _clock(hour, minute, meridiem)
+            return datetime(int(year), int(month), int(day), h, m)
         
-        logger.info(f"Total unique events: {len(unique_events)}")
-        return unique_events
-    
-    def filter_high_medium(self, events: List[EconomicEvent]) -> List[EconomicEvent]:
-        """Filter to only high and medium impact events"""
-        filtered = [e for e in events if e.impact in ['High', 'Medium']]
-        logger.info(f"After filtering: {len(filtered)} high/medium impact events")
-        return filtered
+        return date_parser.parse(text, ignoretz=True)
+    except (ValueError, OverflowError) as e:
+        logger.debug(f"Could not parse calendar time {time_str!r}: {e}")
+        return None
 
 
 # ============================================================================
-# OUTPUT GENERATORS
+# HTTP CLIENT
 # ============================================================================
 
-class PineScriptGenerator:
-    """Generate Pine Script compatible output"""
-    
-    @staticmethod
-    def generate_pine_arrays(events: List[EconomicEvent]) -> str:
-        """Generate Pine Script array definitions"""
-        
-        script_lines = [
-            "// ===== Auto-Generated Event Arrays (DO NOT EDIT MANUALLY) =====",
+def _cached_events(dicts: List[Dict]) -> List[EconomicEvent]:
+    """Rebuild cached events (past ones included, as the parser returned them)"""
+    return [EconomicEvent.from_dict(d) for d in dicts]
+
+
+def _parser_tag(parse: Callable) -> str:
+    """Identifies the parser output cached events came from"""
+    return f"{getattr(parse, '__qualname__', parse)}|v{PARSED_CACHE_VERSION}"
+
+
+def _write_json_atomic(path: str, data: Dict):
+    """Write JSON via a temp file so readers never see a partial entry"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def make_soup(content: bytes, parse_only: Optional[SoupStrainer] = None,
+              parser: Optional[str] = None) -> BeautifulSoup:
+    """Build a soup with the configured parser, restricted to parse_only if enabled"""
+    if not RESTRICTED_PARSING:
+        parse_only = None
+    return BeautifulSoup(content, parser or HTML_PARSER, parse_only=parse_only)
+
+
+class ResponseCache:
+    """On-disk cache of HTTP validators and the events parsed from each response"""
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+    
+    @staticmethod
+    def key(url: str, params: Optional[Dict], parse: Callable) -> str:
+        """Stable cache key for a URL + query parameters and the parser version
+        
+        Entries store parsed events, so a new parser (or PARSED_CACHE_VERSION)
+        must not be answered from them even when the server replies 304.
+        """
+        query = json.dumps(sorted((params or {}).items()), default=str)
+        return hashlib.sha256(f"{url}?{query}|{_parser_tag(parse)}".encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def _load(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def validators(self, key: str) -> Dict[str, str]:
+        """Conditional request headers for a previously cached response"""
+        entry = self._load(key)
+        if not entry or entry.get('events') is None:
+            return {}
+        
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def load_events(self, key: str) -> Optional[List[EconomicEvent]]:
+        """Previously parsed events for this key"""
+        entry = self._load(key)
+        if not entry or entry.get('events') is None:
+            return None
+        
+        return _cached_events(entry['events'])
+    
+    def store(self, key: str, response: requests.Response, events: List[EconomicEvent]):
+        """Persist validators and parsed events (only if the server sent validators)"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        entry = {
+            'url': response.url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_utc': datetime.now(UTC).isoformat(),
+            'events': [event.to_dict() for event in events]
+        }
+        try:
+            _write_json_atomic(self._path(key), entry)
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry for {response.url}: {e}")
+
+
+class ParsedEventCache:
+    """Size-bounded on-disk cache of parsed events keyed by response body hash"""
+    
+    def __init__(self, directory: str, max_entries: int = PARSED_CACHE_MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+    
+    @staticmethod
+    def key(content: bytes, parse: Callable) -> str:
+        """Hash of the body plus the parser that produced the events"""
+        digest = hashlib.sha256(content)
+        digest.update(f"|{_parser_tag(parse)}".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[List[EconomicEvent]]:
+        """Cached events for this body, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return _cached_events(entry.get('events', []))
+    
+    def put(self, key: str, events: List[EconomicEvent]):
+        """Store parsed events, then evict least recently used entries"""
+        try:
+            _write_json_atomic(self._path(key), {'events': [event.to_dict() for event in events]})
+            self._evict()
+        except OSError as e:
+            logger.warning(f"Could not write parsed-event cache entry: {e}")
+    
+    def _evict(self):
+        entries = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                   if name.endswith('.json')]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class HttpClient:
+    """Pooled HTTP client shared by all fetchers (keep-alive + TLS session reuse)"""
+    
+    def __init__(self, pool_connections: int = HTTP_POOL_CONNECTIONS,
+                 pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                 max_retries: int = HTTP_MAX_RETRIES,
+                 timeout: float = HTTP_TIMEOUT_SECONDS,
+                 cache: Optional[ResponseCache] = None,
+                 parsed_cache: Optional[ParsedEventCache] = None):
+        self.timeout = timeout
+        self.cache = cache
+        self.parsed_cache = parsed_cache
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        
+        # One adapter per scheme; urllib3 keeps a separate pool per host inside it
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              max_retries=max_retries,
+                              pool_block=False)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def get(self, url: str, params: Optional[Dict] = None,
+            timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """GET through the shared pool"""
+        return self.session.get(url, params=params,
+                                timeout=timeout if timeout is not None else self.timeout,
+                                **kwargs)
+    
+    def fetch_events(self, url: str, parse: Callable[[bytes], List[EconomicEvent]],
+                     params: Optional[Dict] = None) -> List[EconomicEvent]:
+        """GET a page and parse it, skipping the parse entirely on 304 Not Modified"""
+        if self.cache is None:
+            response = self.get(url, params=params)
+            response.raise_for_status()
+            return self._parse(url, response.content, parse)
+        
+        key = self.cache.key(url, params, parse)
+        response = self.get(url, params=params, headers=self.cache.validators(key))
+        
+        if response.status_code == 304:
+            cached = self.cache.load_events(key)
+            if cached is not None:
+                logger.info(f"{url}: not modified, reusing {len(cached)} cached events")
+                return cached
+            # Cache entry vanished between the request and now; ask again unconditionally
+            response = self.get(url, params=params)
+        
+        response.raise_for_status()
+        events = self._parse(url, response.content, parse)
+        self.cache.store(key, response, events)
+        return events
+    
+    def _parse(self, url: str, content: bytes,
+               parse: Callable[[bytes], List[EconomicEvent]]) -> List[EconomicEvent]:
+        """Parse a body, reusing earlier results for byte-identical content"""
+        if self.parsed_cache is None:
+            return parse(content)
+        
+        key = self.parsed_cache.key(content, parse)
+        events = self.parsed_cache.get(key)
+        if events is not None:
+            logger.info(f"{url}: body unchanged, reusing {len(events)} parsed events")
+            return events
+        
+        events = parse(content)
+        self.parsed_cache.put(key, events)
+        return events
+    
+    def close(self):
+        """Close every pooled connection"""
+        self.session.close()
+    
+    def __enter__(self) -> 'HttpClient':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_client: Optional[HttpClient] = None
+
+
+def get_default_client() -> HttpClient:
+    """Process-wide client used when a fetcher isn't given one explicitly"""
+    global _default_client
+    if _default_client is None:
+        _default_client = HttpClient(
+            cache=ResponseCache(HTTP_CACHE_DIR) if HTTP_CACHE_DIR else None,
+            parsed_cache=ParsedEventCache(PARSED_CACHE_DIR) if PARSED_CACHE_DIR else None
+        )
+    return _default_client
+
+
+# ============================================================================
+# BUSINESS DAY CALENDAR
+# ============================================================================
+
+MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY = range(7)
+
+
+def _nth_weekday_of_month(year: int, month: int, n: int, weekday: int) -> date:
+    """nth weekday of a month; n = -1 gives the last one"""
+    first_weekday, days = calendar.monthrange(year, month)
+    if n > 0:
+        return date(year, month, 1 + (weekday - first_weekday) % 7 + 7 * (n - 1))
+    last_weekday = (first_weekday + days - 1) % 7
+    return date(year, month, days - (last_weekday - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """Federal observance: Saturday holidays move to Friday, Sunday ones to Monday"""
+    if day.weekday() == SATURDAY:
+        return day - timedelta(days=1)
+    if day.weekday() == SUNDAY:
+        return day + timedelta(days=1)
+    return day
+
+
+def us_federal_holidays(year: int) -> List[Tuple[date, str]]:
+    """Observed US federal holidays for a year (5 U.S.C. 6103), in date order
+    
+    An observed date can fall in the neighbouring year (New Year's Day on a
+    Saturday is observed on Dec 31); it is listed under the holiday's own year.
+    """
+    holidays = [
+        (_observed(date(year, 1, 1)), "New Year's Day"),
+        (_nth_weekday_of_month(year, 1, 3, MONDAY), 'Martin Luther King Jr. Day'),
+        (_nth_weekday_of_month(year, 2, 3, MONDAY), "Washington's Birthday"),
+        (_nth_weekday_of_month(year, 5, -1, MONDAY), 'Memorial Day'),
+        (_observed(date(year, 7, 4)), 'Independence Day'),
+        (_nth_weekday_of_month(year, 9, 1, MONDAY), 'Labor Day'),
+        (_nth_weekday_of_month(year, 10, 2, MONDAY), 'Columbus Day'),
+        (_observed(date(year, 11, 11)), 'Veterans Day'),
+        (_nth_weekday_of_month(year, 11, 4, THURSDAY), 'Thanksgiving Day'),
+        (_observed(date(year, 12, 25)), 'Christmas Day'),
+    ]
+    if year >= 2021:
+        holidays.append((_observed(date(year, 6, 19)), 'Juneteenth National Independence Day'))
+    return sorted(holidays)
+
+
+class BusinessDayCalendar:
+    """US business days (weekdays that aren't federal holidays) for a span of years
+    
+    Precomputes a bitset (one byte per day) for O(1) membership tests and a
+    sorted array of business-day ordinals for O(log n) next/previous/offset
+    queries via binary search. Queries outside the span extend it.
+    """
+    
+    def __init__(self, start_year: int = BUSINESS_CALENDAR_START_YEAR,
+                 end_year: int = BUSINESS_CALENDAR_END_YEAR):
+        self._build(start_year, end_year)
+    
+    def _build(self, start_year: int, end_year: int):
+        self.start_year = start_year
+        self.end_year = end_year
+        self._first_ordinal = date(start_year, 1, 1).toordinal()
+        last_ordinal = date(end_year, 12, 31).toordinal()
+        
+        holiday_ordinals = {day.toordinal()
+                            for year in range(start_year - 1, end_year + 2)
+                            for day, _ in us_federal_holidays(year)}
+        
+        # Monday of ordinal 1 (0001-01-01) is weekday 0, so weekday = (ordinal - 1) % 7
+        self._is_business = bytearray(
+            1 if (o - 1) % 7 < SATURDAY and o not in holiday_ordinals else 0
+            for o in range(self._first_ordinal, last_ordinal + 1))
+        self._ordinals = array('l', compress(range(self._first_ordinal, last_ordinal + 1),
+                                             self._is_business))
+    
+    def _ensure(self, day: date):
+        # Keep a year of margin so next/previous near the edges stay inside the span
+        if not self.start_year < day.year < self.end_year:
+            self._build(min(self.start_year, day.year - 1), max(self.end_year, day.year + 1))
+    
+    def is_business_day(self, day: date) -> bool:
+        """O(1) bitset lookup"""
+        self._ensure(day)
+        return bool(self._is_business[day.toordinal() - self._first_ordinal])
+    
+    def next_business_day(self, day: date, inclusive: bool = False) -> date:
+        """First business day after day (or on it, if inclusive)"""
+        self._ensure(day)
+        search = bisect.bisect_left if inclusive else bisect.bisect_right
+        return date.fromordinal(self._ordinals[search(self._ordinals, day.toordinal())])
+    
+    def previous_business_day(self, day: date, inclusive: bool = False) -> date:
+        """Last business day before day (or on it, if inclusive)"""
+        self._ensure(day)
+        search = bisect.bisect_right if inclusive else bisect.bisect_left
+        return date.fromordinal(self._ordinals[search(self._ordinals, day.toordinal()) - 1])
+    
+    def add_business_days(self, day: date, n: int) -> date:
+        """n business days after day (before it if n < 0); n = 0 rolls forward"""
+        if n == 0:
+            return self.next_business_day(day, inclusive=True)
+        # Make sure the span covers the target as well as the start
+        self._ensure(day + timedelta(days=2 * n + (7 if n > 0 else -7)))
+        self._ensure(day)
+        ordinal = day.toordinal()
+        if n > 0:
+            return date.fromordinal(self._ordinals[bisect.bisect_right(self._ordinals, ordinal) + n - 1])
+        return date.fromordinal(self._ordinals[bisect.bisect_left(self._ordinals, ordinal) + n])
+    
+    def roll_ordinal(self, ordinal: int, roll: str) -> int:
+        """Move a day (as ordinal) to the 'preceding'/'following' business day if needed"""
+        index = ordinal - self._first_ordinal
+        if 0 <= index < len(self._is_business) and self._is_business[index]:
+            return ordinal
+        day = date.fromordinal(ordinal)
+        if roll == 'preceding':
+            return self.previous_business_day(day).toordinal()
+        return self.next_business_day(day).toordinal()
+    
+    def business_days_in_month(self, year: int, month: int) -> Tuple[int, ...]:
+        """Day numbers of the month's business days, ascending"""
+        first = date(year, month, 1)
+        self._ensure(first)
+        lo = bisect.bisect_left(self._ordinals, first.toordinal())
+        hi = bisect.bisect_left(self._ordinals, first.toordinal() + calendar.monthrange(year, month)[1])
+        return tuple(date.fromordinal(o).day for o in self._ordinals[lo:hi])
+
+
+_business_calendar: Optional[BusinessDayCalendar] = None
+
+
+def business_calendar() -> BusinessDayCalendar:
+    """Shared US business-day calendar (built on first use)"""
+    global _business_calendar
+    if _business_calendar is None:
+        _business_calendar = BusinessDayCalendar()
+    return _business_calendar
+
+
+# ============================================================================
+# RECURRENCE RULES
+# ============================================================================
+
+class MonthTable(NamedTuple):
+    """Precomputed facts about one calendar month"""
+    year: int
+    month: int
+    first_weekday: int               # weekday of the 1st (Monday = 0)
+    days: int                        # number of days in the month
+    business_days: Tuple[int, ...]   # day numbers of business days, ascending
+
+
+@functools.lru_cache(maxsize=None)
+def month_table(year: int, month: int) -> MonthTable:
+    """Month table for (year, month); computed once per process"""
+    first_weekday, days = calendar.monthrange(year, month)
+    business_days = business_calendar().business_days_in_month(year, month)
+    return MonthTable(year, month, first_weekday, days, business_days)
+
+
+def iter_months(start: date, end: date) -> Iterator[Tuple[int, int]]:
+    """(year, month) for every month overlapping [start, end)"""
+    year, month = start.year, start.month
+    while date(year, month, 1) < end:
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+class RecurrenceRule:
+    """Base class: a rule that picks dates, month by month
+    
+    roll says what to do when a picked date is not a business day: move to
+    the 'preceding' or 'following' business day, or None to keep it. A
+    'preceding' roll never leaves the month: if it would, fallback() picks
+    a later date instead.
+    """
+    
+    roll: Optional[str] = None
+    
+    def days_in_month(self, table: MonthTable) -> List[int]:
+        """Day numbers this rule selects in the month described by table"""
+        raise NotImplementedError
+    
+    def fallback(self, day: date) -> date:
+        """Date to use for day when rolling back would leave its month"""
+        return business_calendar().next_business_day(day, inclusive=True)
+    
+    def expand(self, start: date, end: date) -> Iterator[date]:
+        """Dates selected by this rule in [start, end), ascending"""
+        if self.roll is None:
+            months = iter_months(start, end)
+        else:
+            # A date just outside the range can roll into it
+            months = iter_months(start - timedelta(days=7), end + timedelta(days=7))
+            business = business_calendar()
+        
+        for year, month in months:
+            for day in self.days_in_month(month_table(year, month)):
+                current = date(year, month, day)
+                if self.roll == 'preceding':
+                    rolled = business.previous_business_day(current, inclusive=True)
+                    current = rolled if rolled.month == month else self.fallback(current)
+                elif self.roll == 'following':
+                    current = business.next_business_day(current, inclusive=True)
+                if start <= current < end:
+                    yield current
+    
+    def expand_ordinals(self, start: date, end: date) -> array:
+        """expand() as an array of date ordinals"""
+        return array('l', (day.toordinal() for day in self.expand(start, end)))
+
+
+class NthWeekday(RecurrenceRule):
+    """The nth given weekday of each month, e.g. first Friday"""
+    
+    def __init__(self, n: int, weekday: int, roll: Optional[str] = None):
+        self.n = n
+        self.weekday = weekday
+        self.roll = roll
+    
+    def days_in_month(self, table: MonthTable) -> List[int]:
+        day = 1 + (self.weekday - table.first_weekday) % 7 + 7 * (self.n - 1)
+        return [day] if day <= table.days else []
+    
+    def fallback(self, day: date) -> date:
+        # Same weekday a week later, e.g. NFP on Friday 2027-01-08 when
+        # Friday 2027-01-01 is New Year's Day
+        return business_calendar().next_business_day(day + timedelta(days=7), inclusive=True)
+
+
+class LastWeekday(RecurrenceRule):
+    """The last given weekday of each month, e.g. last Friday"""
+    
+    def __init__(self, weekday: int, roll: Optional[str] = None):
+        self.weekday = weekday
+        self.roll = roll
+    
+    def days_in_month(self, table: MonthTable) -> List[int]:
+        last_weekday = (table.first_weekday + table.days - 1) % 7
+        return [table.days - (last_weekday - self.weekday) % 7]
+
+
+class NthBusinessDay(RecurrenceRule):
+    """The nth business day of each month (holidays excluded); negative n counts from the end"""
+    
+    def __init__(self, n: int):
+        self.n = n
+    
+    def days_in_month(self, table: MonthTable) -> List[int]:
+        index = self.n - 1 if self.n > 0 else self.n
+        try:
+            return [table.business_days[index]]
+        except IndexError:
+            return []
+
+
+class MonthDay(RecurrenceRule):
+    """A fixed day of the month, moved to the next business day (or the
+    previous one if none is left in the month)"""
+    
+    def __init__(self, day: int):
+        self.day = day
+    
+    def days_in_month(self, table: MonthTable) -> List[int]:
+        day = min(self.day, table.days)
+        index = bisect.bisect_left(table.business_days, day)
+        if index < len(table.business_days):
+            return [table.business_days[index]]
+        return [table.business_days[-1]] if table.business_days else []
+
+
+class Weekly(RecurrenceRule):
+    """Every given weekday
+    
+    Expanded directly as an ordinal range rather than month by month.
+    """
+    
+    def __init__(self, weekday: int, roll: Optional[str] = None):
+        self.weekday = weekday
+        self.roll = roll
+    
+    def days_in_month(self, table: MonthTable) -> List[int]:
+        first = 1 + (self.weekday - table.first_weekday) % 7
+        return list(range(first, table.days + 1, 7))
+    
+    def expand_ordinals(self, start: date, end: date) -> array:
+        lo, hi = start.toordinal(), end.toordinal()
+        if self.roll is None:
+            first = lo + (self.weekday - start.weekday()) % 7
+            return array('l', range(first, hi, 7))
+        
+        # A date just outside the range can roll into it
+        padded = start - timedelta(days=7)
+        first = padded.toordinal() + (self.weekday - padded.weekday()) % 7
+        roll = functools.partial(business_calendar().roll_ordinal, roll=self.roll)
+        return array('l', (o for o in map(roll, range(first, hi + 7, 7)) if lo <= o < hi))
+    
+    def expand(self, start: date, end: date) -> Iterator[date]:
+        return map(date.fromordinal, self.expand_ordinals(start, end))
+
+
+class ScheduledRelease(NamedTuple):
+    """A recurring release: rule for the dates, US/Eastern wall-clock time"""
+    name: str
+    rule: RecurrenceRule
+    hour_et: int
+    minute_et: int
+    impact: str
+    
+    def expand(self, start: date, end: date) -> Iterator[datetime]:
+        """UTC release times for every date in [start, end)"""
+        for day in self.rule.expand(start, end):
+            yield EASTERN.to_utc(datetime(day.year, day.month, day.day, self.hour_et, self.minute_et))
+    
+    def expand_ms(self, start: date, end: date) -> array:
+        """UTC epoch-ms release times for every date in [start, end), in bulk"""
+        ms_of_day = (self.hour_et * 60 + self.minute_et) * 60_000
+        return EASTERN.utc_ms_for_dates(self.rule.expand_ordinals(start, end), ms_of_day)
+
+
+# ============================================================================
+# FETCHER CLASSES
+# ============================================================================
+
+class InvestingComFetcher:
+    """Fetch events from Investing.com Economic Calendar"""
+    
+    BASE_URL = "https://www.investing.com/economic-calendar/"
+    
+    def __init__(self, http: Optional[HttpClient] = None):
+        self.http = http or get_default_client()
+    
+    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
+        """Fetch events from Investing.com"""
+        events = []
+        try:
+            logger.info("Fetching from Investing.com...")
+            
+            # Note: Investing.com requires specific headers and may have anti-scraping
+            # This is a simplified approach; for production, consider using their calendar API
+            # or a dedicated library like investpy
+            
+            # Fallback: Provide instruction to use alternative sources
+            logger.warning("Investing.com requires advanced scraping. Using alternative sources only.")
+            
+        except Exception as e:
+            logger.error(f"Investing.com fetch failed: {e}")
+        
+        return events
+
+
+class ForexFactoryFetcher:
+    """Fetch events from Forex Factory Economic Calendar"""
+    
+    BASE_URL = "https://www.forexfactory.com/calendar.php"
+    ROW_STRAINER = SoupStrainer('tr')
+    
+    def __init__(self, http: Optional[HttpClient] = None):
+        self.http = http or get_default_client()
+    
+    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
+        """Fetch events from Forex Factory"""
+        events = []
+        try:
+            logger.info("Fetching from Forex Factory...")
+            
+            # Construct URL with parameters
+            params = {
+                'month': 'all',
+                'country': 'us'  # US events only
+            }
+            
+            events = self.http.fetch_events(self.BASE_URL, self._parse_events, params=params)
+            
+            logger.info(f"Forex Factory: Found {len(events)} events")
+        
+        except Exception as e:
+            logger.error(f"Forex Factory fetch failed: {e}")
+        
+        return events
+    
+    def _parse_events(self, content: bytes) -> List[EconomicEvent]:
+        """Parse calendar rows out of a Forex Factory page"""
+        events = []
+        soup = make_soup(content, self.ROW_STRAINER)
+        
+        # Forex Factory table structure: <table> with rows containing event data
+        rows = soup.find_all('tr', {'class': 'calendar__row'})
+        
+        if not rows:
+            # Try alternative selector
+            rows = soup.find_all('tr')
+        
+        for row in rows:
+            try:
+                # Extract event data from row
+                cells = row.find_all('td')
+                if len(cells) < 5:
+                    continue
+                
+                # Typical structure: Date | Time | Impact | Event | Forecast | Previous | Actual
+                event_name = cells[2].text.strip() if len(cells) > 2 else ''
+                impact_str = cells[1].text.strip() if len(cells) > 1 else ''
+                forecast = cells[4].text.strip() if len(cells) > 4 else None
+                previous = cells[5].text.strip() if len(cells) > 5 else None
+                
+                # Skip if not high/medium impact, unless it is a special
+                # (political / market-shock) event, which is kept as Medium
+                keyword_impact = IMPACT_CLASSIFIER.classify(event_name)
+                if keyword_impact is None:
+                    if not SPECIAL_EVENT_CLASSIFIER.matches(event_name):
+                        continue
+                    keyword_impact = 'Medium'
+                
+                # Parse time (Forex Factory uses specific format)
+                time_str = cells[0].text.strip() if len(cells) > 0 else ''
+                event_time = self._parse_time(time_str)
+                
+                # Past rows are kept; the aggregator and output window decide what history to use
+                if event_time:
+                    # The impact cell is often only an icon; fall back to the keyword tier
+                    if impact_str:
+                        impact = 'High' if 'High' in impact_str else 'Medium'
+                    else:
+                        impact = keyword_impact
+                    event = EconomicEvent(
+                        name=event_name,
+                        event_time_utc=event_time,
+                        impact=impact,
+                        forecast=forecast if forecast and forecast.lower() != 'n/a' else None,
+                        previous=previous if previous and previous.lower() != 'n/a' else None,
+                        source='Forex Factory'
+                    )
+                    events.append(event)
+            
+            except Exception as e:
+                logger.debug(f"Error parsing Forex Factory row: {e}")
+                continue
+        
+        return events
+    
+    def _parse_time(self, time_str: str) -> Optional[datetime]:
+        """Parse time string from Forex Factory"""
+        # Forex Factory uses format like "2025-01-15 15:30" or "Jan 15, 2025 3:30 PM"
+        parsed = parse_calendar_time(time_str)
+        return EASTERN.to_utc(parsed) if parsed else None
+
+
+class FedCalendarFetcher:
+    """Fetch FOMC events from Federal Reserve calendar"""
+    
+    BASE_URL = "https://www.federalreserve.gov/newsevents.htm"
+    FOMC_CALENDAR_URL = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
+    LINK_STRAINER = SoupStrainer('a', href=True)
+    
+    def __init__(self, http: Optional[HttpClient] = None):
+        self.http = http or get_default_client()
+    
+    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
+        """Fetch FOMC events from Federal Reserve"""
+        events = []
+        try:
+            logger.info("Fetching FOMC events from Federal Reserve...")
+            
+            # FOMC meeting calendar
+            events = self.http.fetch_events(self.FOMC_CALENDAR_URL, self._parse_events)
+            
+            logger.info(f"Federal Reserve: Found {len(events)} FOMC events")
+        
+        except Exception as e:
+            logger.error(f"Federal Reserve fetch failed: {e}")
+        
+        return events
+    
+    def _parse_events(self, content: bytes) -> List[EconomicEvent]:
+        """Parse FOMC meeting links out of the Fed calendar page"""
+        events = []
+        soup = make_soup(content, self.LINK_STRAINER)
+        
+        # Look for FOMC meeting dates (typically 2:00 PM ET on meeting days)
+        # Pattern: Look for text containing "FOMC" and dates
+        links = soup.find_all('a', href=True)
+        
+        for link in links:
+            text = link.text.strip()
+            if 'FOMC' in text or 'Federal Open' in text:
+                # Try to extract date from link text or nearby content
+                try:
+                    # FOMC meetings are typically at 2:00 PM ET on announced dates
+                    # Default: 2:00 PM ET on Wednesday (press release time)
+                    date_match = re.search(r'(\w+)\s+(\d+),?\s+(\d{4})', text)
+                    if date_match:
+                        month_str, day_str, year_str = date_match.groups()
+                        event_date_str = f"{month_str} {day_str}, {year_str} 2:00 PM"
+                        event_time = date_parser.parse(event_date_str)
+                        event_time = EASTERN.to_utc(event_time) if event_time.tzinfo is None else event_time
+                        
+                        # Past meetings are kept too (see EventAggregator.iter_events)
+                        for event_type in ['Interest Rate Decision', 'Economic Projections', 'Press Conference']:
+                            time_offset = timedelta(minutes=30) if 'Press' in event_type else timedelta(0)
+                            event = EconomicEvent(
+                                name=f"FOMC {event_type}",
+                                event_time_utc=event_time + time_offset,
+                                impact='High',
+                                source='Federal Reserve'
+                            )
+                            events.append(event)
+                except Exception as e:
+                    logger.debug(f"Error parsing FOMC date: {e}")
+                    continue
+        
+        return events
+
+
+class HardcodedFetcher:
+    """Fallback schedule: FOMC data tables plus recurring release rules, for any date range"""
+    
+    # FOMC rate decision days (second day of each meeting), announced 2:00 PM ET
+    FOMC_DECISION_DATES = {
+        2024: ['2024-01-31', '2024-03-20', '2024-05-01', '2024-06-12',
+               '2024-07-31', '2024-09-18', '2024-11-07', '2024-12-18'],
+        2025: ['2025-01-29', '2025-03-19', '2025-05-07', '2025-06-18',
+               '2025-07-30', '2025-09-17', '2025-10-29', '2025-12-10'],
+        2026: ['2026-01-28', '2026-03-18', '2026-04-29', '2026-06-17',
+               '2026-07-29', '2026-09-16', '2026-10-28', '2026-12-09'],
+        2027: ['2027-01-27', '2027-03-17', '2027-04-28', '2027-06-09',
+               '2027-07-28', '2027-09-15', '2027-10-27', '2027-12-08'],
+    }
+    FOMC_HOUR_ET, FOMC_MINUTE_ET = 14, 0
+    # Summary of Economic Projections is published at these meetings only
+    FOMC_PROJECTION_MONTHS = {3, 6, 9, 12}
+    
+    # Typical release rules; times are US/Eastern wall clock
+    SCHEDULE = [
+        # Week 1
+        ScheduledRelease('Employment Report (NFP)', NthWeekday(1, FRIDAY, roll='preceding'), 8, 30, 'High'),
+        ScheduledRelease('Jobless Claims', Weekly(THURSDAY, roll='preceding'), 8, 30, 'High'),
+        ScheduledRelease('Continuing Jobless Claims', Weekly(THURSDAY, roll='preceding'), 8, 30, 'Medium'),
+        ScheduledRelease('MBA Mortgage Applications', Weekly(WEDNESDAY, roll='following'), 7, 0, 'Medium'),
+        ScheduledRelease('ISM Manufacturing PMI', NthBusinessDay(1), 10, 0, 'High'),
+        ScheduledRelease('ISM Services PMI', NthBusinessDay(3), 10, 0, 'Medium'),
+        
+        # Week 2
+        ScheduledRelease('CPI Release', NthWeekday(2, WEDNESDAY, roll='following'), 8, 30, 'High'),
+        ScheduledRelease('PPI Release', NthWeekday(2, THURSDAY, roll='following'), 8, 30, 'High'),
+        ScheduledRelease('Retail Sales', MonthDay(15), 8, 30, 'High'),
+        
+        # Week 3-4
+        ScheduledRelease('Durable Goods Orders', LastWeekday(FRIDAY, roll='preceding'), 8, 30, 'Medium'),
+        ScheduledRelease('Personal Income', NthBusinessDay(-1), 8, 30, 'Medium'),
+        ScheduledRelease('Personal Spending', NthBusinessDay(-1), 8, 30, 'Medium'),
+        ScheduledRelease('PCE Price Index', NthBusinessDay(-1), 8, 30, 'High'),
+        
+        # Housing
+        ScheduledRelease('Housing Starts', MonthDay(18), 8, 30, 'High'),
+        ScheduledRelease('Building Permits', MonthDay(18), 8, 30, 'Medium'),
+        ScheduledRelease('Existing Home Sales', MonthDay(22), 10, 0, 'High'),
+        ScheduledRelease('New Home Sales', MonthDay(25), 10, 0, 'Medium'),
+    ]
+    
+    def __init__(self):
+        self._fomc_by_month: Dict[Tuple[int, int], List[date]] = {}
+        for dates in self.FOMC_DECISION_DATES.values():
+            for date_str in dates:
+                day = datetime.strptime(date_str, '%Y-%m-%d').date()
+                self._fomc_by_month.setdefault((day.year, day.month), []).append(day)
+        self._fomc_warned = set()
+    
+    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
+        """Return scheduled US economic events for the next days_ahead days"""
+        events = list(self.stream(days_ahead))
+        logger.info(f"Hardcoded Fetcher: Generated {len(events)} events")
+        return events
+    
+    def stream(self, days_ahead: int = 365, days_back: float = 0) -> Iterator[EconomicEvent]:
+        """Like fetch(), but lazily and in time order, starting days_back before now"""
+        now = datetime.now(UTC)
+        end = now + timedelta(days=days_ahead)
+        return self.iter_events(now - timedelta(days=days_back), end)
+    
+    def iter_events(self, start: datetime, end: datetime) -> Iterator[EconomicEvent]:
+        """Lazily yield events in [start, end) in time order, one month at a time
+        
+        Only the current month is ever materialized, so callers can take a
+        month or a decade and stop whenever they like.
+        """
+        self._check_fomc_coverage(start, end)
+        start_ms, end_ms = to_epoch_ms(start), to_epoch_ms(end)
+        
+        # Pad by a day: a local ET date can differ from its UTC date
+        for year, month in iter_months(start.date() - timedelta(days=1), end.date() + timedelta(days=1)):
+            month_start = date(year, month, 1)
+            month_end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+            
+            batch = self._fomc_events(year, month)
+            for release in self.SCHEDULE:
+                for timestamp_ms in release.expand_ms(month_start, month_end):
+                    batch.append(EconomicEvent.from_timestamp_ms(
+                        name=release.name,
+                        timestamp_ms=timestamp_ms,
+                        impact=release.impact,
+                        source='Hardcoded Schedule'
+                    ))
+            
+            batch.sort(key=lambda e: e.timestamp_ms)
+            for event in batch:
+                if start_ms <= event.timestamp_ms < end_ms:
+                    yield event
+    
+    def _check_fomc_coverage(self, start: datetime, end: datetime):
+        """Warn (once per side) if [start, end) reaches outside the FOMC table"""
+        first, last = min(self.FOMC_DECISION_DATES), max(self.FOMC_DECISION_DATES)
+        if start.year < first and 'before' not in self._fomc_warned:
+            self._fomc_warned.add('before')
+            logger.warning(f"Hardcoded Fetcher: no FOMC dates before {first}, FOMC events will be missing")
+        if (end - timedelta(microseconds=1)).year > last and 'after' not in self._fomc_warned:
+            self._fomc_warned.add('after')
+            logger.warning(f"Hardcoded Fetcher: no FOMC dates after {last}, FOMC events will be missing")
+    
+    def _fomc_events(self, year: int, month: int) -> List[EconomicEvent]:
+        """Decision, projections (quarterly) and press conference for a month's meetings"""
+        events = []
+        for day in self._fomc_by_month.get((year, month), ()):
+            event_time = EASTERN.to_utc(datetime(day.year, day.month, day.day,
+                                                 self.FOMC_HOUR_ET, self.FOMC_MINUTE_ET))
+            
+            event_types = ['Interest Rate Decision']
+            if month in self.FOMC_PROJECTION_MONTHS:
+                event_types.append('Economic Projections')
+            for event_type in event_types:
+                events.append(EconomicEvent(
+                    name=f"FOMC {event_type}",
+                    event_time_utc=event_time,
+                    impact='High',
+                    source='Federal Reserve (Hardcoded)'
+                ))
+            
+            # Press Conference 30 mins after
+            events.append(EconomicEvent(
+                name="FOMC Press Conference",
+                event_time_utc=event_time + timedelta(minutes=30),
+                impact='High',
+                source='Federal Reserve (Hardcoded)'
+            ))
+        return events
+
+
+class TrumpAnnouncementMonitor:
+    """Monitor for Trump announcements and special events"""
+    
+    def __init__(self, http: Optional[HttpClient] = None):
+        self.http = http or get_default_client()
+    
+    def fetch(self, days_ahead: int = 365) -> List[EconomicEvent]:
+        """Fetch Trump-related announcements"""
+        events = []
+        try:
+            logger.info("Monitoring for Trump announcements...")
+            # This would require monitoring news sources or Twitter/X
+            # For now, skip automated monitoring and rely on manual input
+            logger.info("Trump announcements: Manual monitoring recommended")
+        except Exception as e:
+            logger.error(f"Trump announcement fetch failed: {e}")
+        
+        return events
+
+
+# ============================================================================
+# DEDUPLICATION
+# ============================================================================
+
+_PARENTHETICAL_RE = re.compile(r'\([^)]*\)')
+_PERIOD_SUFFIX_RE = re.compile(r'\b(m/m|y/y|q/q|mom|yoy|qoq)\b')
+_NAME_NOISE_RE = re.compile(r'[^a-z0-9/ ]+')
+_FILLER_WORDS = {'us', 'release', 'report', 'data'}
+
+
+def _normalize_name(name: str) -> Tuple[str, Optional[str]]:
+    """Lowercase, drop parentheticals/punctuation/filler; split off m/m-style period"""
+    text = _PARENTHETICAL_RE.sub(' ', name.lower())
+    period = None
+    match = _PERIOD_SUFFIX_RE.search(text)
+    if match:
+        period = {'mom': 'm/m', 'yoy': 'y/y', 'qoq': 'q/q'}.get(match.group(1), match.group(1))
+        text = _PERIOD_SUFFIX_RE.sub(' ', text)
+    text = _NAME_NOISE_RE.sub(' ', text.replace('-', ''))
+    words = [w for w in text.split() if w not in _FILLER_WORDS]
+    return ' '.join(words), period
+
+
+class EventDeduplicator:
+    """Near-duplicate removal across sources via canonical names and time buckets
+    
+    Names go through an alias index so e.g. 'CPI Release' and 'CPI m/m' share
+    the canonical name 'cpi'. Events are hashed into buckets of one tolerance
+    width, so each event is only compared with the (few) open groups in its own
+    and neighbouring buckets. Two events are duplicates when their canonical
+    names match, their periods (m/m, y/y, ...) match or one has none, and they
+    are within the tolerance. Duplicates are folded field by field by source
+    priority (see merge_sorted / fold).
+    """
+    
+    def __init__(self, aliases: Dict[str, List[str]] = EVENT_ALIASES,
+                 tolerance_minutes: int = DEDUP_TOLERANCE_MINUTES):
+        self.tolerance_ms = max(1, tolerance_minutes) * 60_000
+        self._alias_index: Dict[str, str] = {}
+        for canonical, names in aliases.items():
+            for alias in [canonical] + names:
+                self._alias_index[_normalize_name(alias)[0]] = canonical
+        self.canonical = functools.lru_cache(maxsize=4096)(self._canonical)
+    
+    def _canonical(self, name: str) -> Tuple[str, Optional[str]]:
+        """(canonical name, period) for an event name"""
+        base, period = _normalize_name(name)
+        return self._alias_index.get(base, base), period
+    
+    def _compatible(self, period: Optional[str], other_period: Optional[str]) -> bool:
+        return period == other_period or period is None or other_period is None
+    
+    def merge_sorted(self, events: Iterable[EconomicEvent]) -> Iterator[EconomicEvent]:
+        """Fold duplicates in a time-sorted stream into one event per group
+        
+        Groups are anchored at their first event's time. A group is folded once
+        the stream is two buckets past it (nothing later can still match), so
+        only a small window of open groups is held at any time. A folded event
+        can take a later member's time, so folded events wait in a small heap
+        until nothing still open can sort before them; output is time-sorted.
+        """
+        tolerance = self.tolerance_ms
+        open_groups: Dict[Tuple[str, int], List[List]] = {}  # (base, bucket) -> [[anchor_ms, period, members]]
+        ready: List[Tuple[int, int, EconomicEvent]] = []    # heap of (timestamp_ms, seq, folded event)
+        seq = 0
+        
+        def flush(before_bucket: int, release_before_ms: Optional[int]):
+            nonlocal seq
+            for key in sorted(k for k in open_groups if k[1] < before_bucket):
+                for _, _, members in open_groups.pop(key):
+                    folded = self.fold(members)
+                    heapq.heappush(ready, (folded.timestamp_ms, seq, folded))
+                    seq += 1
+            while ready and (release_before_ms is None or ready[0][0] < release_before_ms):
+                yield heapq.heappop(ready)[2]
+        
+        last_bucket = None
+        for event in events:
+            base, period = self.canonical(event.name)
+            ms = event.timestamp_ms
+            bucket = ms // tolerance
+            
+            if last_bucket is not None and bucket > last_bucket:
+                # Groups still open are anchored at or after (bucket - 1) * tolerance
+                yield from flush(bucket - 1, (bucket - 1) * tolerance)
+            last_bucket = bucket
+            
+            best = None
+            for neighbour in (bucket - 1, bucket):
+                for group in open_groups.get((base, neighbour), ()):
+                    distance = ms - group[0]
+                    if distance <= tolerance and self._compatible(period, group[1]):
+                        if best is None or distance < ms - best[0]:
+                            best = group
+            
+            if best is None:
+                open_groups.setdefault((base, bucket), []).append([ms, period, [event]])
+            else:
+                best[2].append(event)
+                if best[1] is None:
+                    best[1] = period
+        
+        yield from flush(last_bucket + 1 if last_bucket is not None else 0, None)
+    
+    def merge(self, events: Iterable[EconomicEvent]) -> List[EconomicEvent]:
+        """Sort by time, fold duplicates and return the merged events in time order"""
+        return list(self.merge_sorted(sorted(events, key=lambda e: e.timestamp_ms)))
+    
+    @staticmethod
+    def _priority(source: str) -> int:
+        try:
+            return SOURCE_PRIORITY.index(source)
+        except ValueError:
+            return len(SOURCE_PRIORITY)
+    
+    def fold(self, members: List[EconomicEvent]) -> EconomicEvent:
+        """Combine duplicates field by field, preferring higher-priority sources"""
+        if len(members) == 1:
+            return members[0]
+        
+        ranked = sorted(members, key=lambda e: self._priority(e.source))
+        
+        def pick(field: str) -> Optional[str]:
+            return next((getattr(e, field) for e in ranked if getattr(e, field) is not None), None)
+        
+        contributors = tuple(dict.fromkeys(c for e in ranked for c in e.contributors))
+        return ranked[0].replace(forecast=pick('forecast'), previous=pick('previous'),
+                                 actual=pick('actual'), contributors=contributors)
+
+
+# ============================================================================
+# EVENT AGGREGATOR
+# ============================================================================
+
+def _run_in_daemon_thread(func: Callable, *args) -> Future:
+    """Call func(*args) on a new daemon thread, returning a Future for its result
+    
+    Unlike ThreadPoolExecutor workers, which the interpreter joins at exit,
+    a daemon thread that overruns the fetch deadline cannot delay shutdown.
+    """
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+    
+    def run():
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name=f"fetcher-{getattr(func, '__qualname__', func)}", daemon=True).start()
+    return future
+
+
+class EventAggregator:
+    """Aggregate events from multiple sources and deduplicate"""
+    
+    def __init__(self, concurrent: bool = CONCURRENT_FETCH,
+                 deadline: float = FETCH_DEADLINE_SECONDS,
+                 http: Optional[HttpClient] = None):
+        self.http = http or get_default_client()
+        self.fetchers = [
+            ForexFactoryFetcher(self.http),
+            FedCalendarFetcher(self.http),
+            HardcodedFetcher(),
+        ]
+        self.concurrent = concurrent
+        self.deadline = deadline
+        self.deduplicator = EventDeduplicator()
+    
+    def fetch_all(self, days_ahead: int = 365) -> List[EconomicEvent]:
+        """Fetch events from all sources and deduplicate"""
+        unique_events = list(self.iter_events(days_ahead, impacts=None))
+        
+        logger.info(f"Total unique events: {len(unique_events)}")
+        return unique_events
+    
+    def iter_events(self, days_ahead: int = 365,
+                    impacts: Optional[Iterable[str]] = ('High', 'Medium'),
+                    days_back: float = 0) -> Iterator[EconomicEvent]:
+        """Streaming pipeline: sources -> k-way merge -> impact filter -> duplicate merge
+        
+        Every source is time-sorted (network results are sorted if needed,
+        streaming sources already are), so one heap merge yields a single
+        time-ordered stream without concatenating and re-sorting everything.
+        Events at the same time come out in canonical-name order (merge_sorted()
+        folds groups in sorted key order), not fetcher order, so output is
+        still deterministic. Events from more than days_back days ago are
+        dropped (sources report past rows too).
+        """
+        sources = [self._time_sorted(events)
+                   for events in self._fetch_sources(days_ahead, lazy=True, days_back=days_back)]
+        stream = heapq.merge(*sources, key=lambda e: e.timestamp_ms)
+        
+        since_ms = utc_now_ms() - int(days_back * MS_PER_DAY)
+        stream = (e for e in stream if e.timestamp_ms >= since_ms)
+        
+        if impacts is not None:
+            wanted = frozenset(impacts)
+            stream = (e for e in stream if e.impact in wanted)
+        
+        # Merge duplicates (canonical names, fuzzy time match), folding fields by source priority
+        return self.deduplicator.merge_sorted(stream)
+    
+    @staticmethod
+    def _time_sorted(events: Iterable[EconomicEvent]) -> Iterable[EconomicEvent]:
+        if isinstance(events, list) and any(a.timestamp_ms > b.timestamp_ms
+                                            for a, b in zip(events, events[1:])):
+            return sorted(events, key=lambda e: e.timestamp_ms)
+        return events
+    
+    def _fetch_sources(self, days_ahead: int, lazy: bool = False,
+                       days_back: float = 0) -> List[Iterable[EconomicEvent]]:
+        """Run every fetcher and return their results in fetcher order
+        
+        With lazy=True, fetchers that can stream (a stream() method) are not
+        run up front; their entry is the lazy iterator instead of a list.
+        """
+        results: List[Iterable[EconomicEvent]] = [[] for _ in self.fetchers]
+        
+        pending = []
+        for i, fetcher in enumerate(self.fetchers):
+            if lazy and hasattr(fetcher, 'stream'):
+                results[i] = fetcher.stream(days_ahead, days_back)
+            else:
+                pending.append(i)
+        
+        if not self.concurrent:
+            for i in pending:
+                fetcher = self.fetchers[i]
+                try:
+                    results[i] = fetcher.fetch(days_ahead)
+                except Exception as e:
+                    logger.error(f"Fetcher {fetcher.__class__.__name__} failed: {e}")
+            return results
+        
+        if not pending:
+            return results
+        
+        futures = {_run_in_daemon_thread(self.fetchers[i].fetch, days_ahead): i for i in pending}
+        try:
+            for future in as_completed(futures, timeout=self.deadline):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.error(f"Fetcher {self.fetchers[i].__class__.__name__} failed: {e}")
+        except FuturesTimeoutError:
+            # Stragglers are abandoned: request timeouts apply per connect/read
+            # (and per retry), so they do not bound a fetch; their daemon
+            # threads keep neither this call nor interpreter exit waiting
+            for future, i in futures.items():
+                if not future.done():
+                    logger.error(f"Fetcher {self.fetchers[i].__class__.__name__} "
+                                 f"missed the {self.deadline}s deadline, skipping")
+        
+        return results
+    
+    def filter_high_medium(self, events: EventSequence) -> EventSequence:
+        """Filter to only high and medium impact events"""
+        if isinstance(events, EventTable):
+            filtered = events.filter_impact('High', 'Medium')
+        else:
+            filtered = [e for e in events if e.impact in ['High', 'Medium']]
+        logger.info(f"After filtering: {len(filtered)} high/medium impact events")
+        return filtered
+
+
+# ============================================================================
+# OUTPUT GENERATORS
+# ============================================================================
+
+def sorted_by_time(events: EventSequence) -> EventSequence:
+    """events in time order (returned as-is when already sorted)"""
+    if isinstance(events, EventTable):
+        return events.sort_by_time()
+    if any(a.timestamp_ms > b.timestamp_ms for a, b in zip(events, events[1:])):
+        return sorted(events, key=lambda e: e.timestamp_ms)
+    return events
+
+
+class _EventTimestamps:
+    """Sequence view of a time-sorted event list's timestamps (for bisect)"""
+    
+    __slots__ = ('events',)
+    
+    def __init__(self, events: List[EconomicEvent]):
+        self.events = events
+    
+    def __len__(self) -> int:
+        return len(self.events)
+    
+    def __getitem__(self, i: int) -> int:
+        return self.events[i].timestamp_ms
+
+
+class OutputWindow(NamedTuple):
+    """Rolling output window around the run time (None leaves that side open)"""
+    
+    lookback_days: Optional[float] = OUTPUT_LOOKBACK_DAYS
+    lookahead_days: Optional[float] = OUTPUT_LOOKAHEAD_DAYS
+    
+    def bounds(self, now_ms: Optional[int] = None) -> Tuple[Optional[int], Optional[int]]:
+        """(start_ms, end_ms) of the window; events need start_ms <= timestamp < end_ms"""
+        if now_ms is None:
+            now_ms = utc_now_ms()
+        return (None if self.lookback_days is None else now_ms - int(self.lookback_days * MS_PER_DAY),
+                None if self.lookahead_days is None else now_ms + int(self.lookahead_days * MS_PER_DAY))
+    
+    def select(self, events: EventSequence, now_ms: Optional[int] = None) -> EventSequence:
+        """The slice of events inside the window, found by binary search on time"""
+        start_ms, end_ms = self.bounds(now_ms)
+        if isinstance(events, EventTable):
+            return events.between(start_ms, end_ms)
+        events = sorted_by_time(events)
+        times = _EventTimestamps(events)
+        lo = 0 if start_ms is None else bisect.bisect_left(times, start_ms)
+        hi = len(events) if end_ms is None else bisect.bisect_left(times, end_ms, lo)
+        return events[lo:hi]
+
+
+def pine_string(value: str) -> str:
+    """Quote value as a Pine string literal"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def pine_wrap(prefix: str, items: List[str], sep: str, suffix: str, indent: str = "  ",
+              per_line: int = PINE_VALUES_PER_LINE) -> List[str]:
+    """prefix + items joined by sep + suffix, continued on indented lines
+    
+    Pine continuation lines must not be indented by a multiple of 4.
+    """
+    chunks = [sep.join(items[i:i + per_line]) for i in range(0, len(items), per_line)]
+    return [(indent if i else prefix) + chunk + (sep.rstrip() if i < len(chunks) - 1 else suffix)
+            for i, chunk in enumerate(chunks)]
+
+
+class PineScriptGenerator:
+    """Generate Pine Script compatible output"""
+    
+    # (array name, element type, value) for every generated array
+    COLUMNS: Tuple[Tuple[str, str, Callable[[EconomicEvent], Union[str, int]]], ...] = (
+        ('event_names', 'string', lambda e: e.name),
+        ('event_times_utc', 'int', lambda e: e.timestamp_ms),
+        ('event_impact', 'string', lambda e: e.impact),
+        ('event_forecast', 'string', lambda e: e.forecast or 'N/A'),
+        ('event_previous', 'string', lambda e: e.previous or 'N/A'),
+    )
+    
+    @staticmethod
+    def banner_lines(count: int, encoding: Optional[str] = None) -> List[str]:
+        """Generated-file banner and the EVENT_COUNT declaration"""
+        lines = [
+            "// ===== Auto-Generated Event Arrays (DO NOT EDIT MANUALLY) =====",
             "// Generated: " + datetime.now(UTC).isoformat(),
-            "// Total Events: " + str(len(events)),
-            "",
-            f"var int EVENT_COUNT = {len(events)}",
+            "// Total Events: " + str(count),
+        ]
+        if encoding:
+            lines.append("// Encoding: " + encoding)
+        return lines + ["", f"var int EVENT_COUNT = {count}"]
+    
+    @staticmethod
+    def header_lines(count: int) -> List[str]:
+        """Script header and array declarations for count events"""
+        return PineScriptGenerator.banner_lines(count) + [
             "var string[] event_names = array.new<string>(EVENT_COUNT)",
             "var int[] event_times_utc = array.new<int>(EVENT_COUNT)",
             "var string[] event_impact = array.new<string>(EVENT_COUNT)",
@@ -531,41 +2039,769 @@ class PineScriptGenerator:
             "var string[] event_previous = array.new<string>(EVENT_COUNT)",
             ""
         ]
+    
+    @staticmethod
+    def event_lines(i: int, event: EconomicEvent) -> List[str]:
+        """array.set statements for the event at index i"""
+        dt = event.event_time_utc
+        timestamp = f"timestamp(\"UTC\", {dt.year}, {dt.month}, {dt.day}, {dt.hour}, {dt.minute})"
         
-        for i, event in enumerate(events):
-            dt = event.event_time_utc
-            timestamp = f"timestamp(\"UTC\", {dt.year}, {dt.month}, {dt.day}, {dt.hour}, {dt.minute})"
-            
-            script_lines.append(f"// {i}: {event.name} - {event.impact} - {event.source}")
-            script_lines.append(f"array.set(event_names, {i}, \"{event.name}\")")
-            script_lines.append(f"array.set(event_times_utc, {i}, {timestamp})")
-            script_lines.append(f"array.set(event_impact, {i}, \"{event.impact}\")")
-            script_lines.append(f"array.set(event_forecast, {i}, \"{event.forecast or 'N/A'}\")")
-            script_lines.append(f"array.set(event_previous, {i}, \"{event.previous or 'N/A'}\")")
-            script_lines.append("")
+        return [
+            f"// {i}: {event.name} - {event.impact} - {event.source}",
+            f"array.set(event_names, {i}, {pine_string(event.name)})",
+            f"array.set(event_times_utc, {i}, {timestamp})",
+            f"array.set(event_impact, {i}, {pine_string(event.impact)})",
+            f"array.set(event_forecast, {i}, {pine_string(event.forecast or 'N/A')})",
+            f"array.set(event_previous, {i}, {pine_string(event.previous or 'N/A')})",
+            ""
+        ]
+    
+    @staticmethod
+    def lookup_helper_lines() -> List[str]:
+        """Pine functions that binary-search the (ascending) event_times_utc array
         
-        return "\n".join(script_lines)
+        event_next_index keeps a cursor that only moves forward while bar time
+        does, so walking the chart costs O(1) amortized per bar; it falls back
+        to a binary search on the first call or when time moves backwards.
+        """
+        return [
+            "// ===== Lookup helpers (event_times_utc is sorted ascending) =====",
+            "// Index of the first event at or after t (EVENT_COUNT if none)",
+            "event_index_at(int t) =>",
+            "    int lo = 0",
+            "    int hi = array.size(event_times_utc)",
+            "    while lo < hi",
+            "        int mid = math.floor((lo + hi) / 2)",
+            "        if array.get(event_times_utc, mid) < t",
+            "            lo := mid + 1",
+            "        else",
+            "            hi := mid",
+            "    lo",
+            "",
+            "// Cursor for event_next_index (an array so functions can update it)",
+            "var int[] event_cursor = array.from(-1)",
+            "",
+            "// Like event_index_at, advancing a cursor monotonically with t",
+            "event_next_index(int t) =>",
+            "    int n = array.size(event_times_utc)",
+            "    int i = array.get(event_cursor, 0)",
+            "    if i < 0",
+            "        i := event_index_at(t)",
+            "    else if i > 0",
+            "        if array.get(event_times_utc, i - 1) >= t",
+            "            i := event_index_at(t)",
+            "    while i < n",
+            "        if array.get(event_times_utc, i) >= t",
+            "            break",
+            "        i += 1",
+            "    array.set(event_cursor, 0, i)",
+            "    i",
+            "",
+            "// Index of the event closest to t (-1 if there are none)",
+            "event_nearest_index(int t) =>",
+            "    int n = array.size(event_times_utc)",
+            "    int i = event_next_index(t)",
+            "    int result = i < n ? i : n - 1",
+            "    if i > 0 and i < n",
+            "        if t - array.get(event_times_utc, i - 1) <= array.get(event_times_utc, i) - t",
+            "            result := i - 1",
+            "    result",
+        ]
+    
+    @staticmethod
+    def subsets_of(event: EconomicEvent, subsets: Tuple[str, ...] = PINE_SUBSETS) -> List[str]:
+        """PINE_SUBSETS the event belongs to: its impact tier and its category"""
+        return [subset for subset in (event.impact.lower(), event_category(event.name)) if subset in subsets]
+    
+    @staticmethod
+    def subset_index_lines(indices: Dict[str, List[int]]) -> List[str]:
+        """event_index_<subset> arrays: rows of the main arrays in each subset"""
+        lines = ["// ===== Subsets: indices into the arrays above, ascending by time ====="]
+        for subset, rows in indices.items():
+            if rows:
+                lines.extend(pine_wrap(f"var int[] event_index_{subset} = array.from(",
+                                       [str(i) for i in rows], ", ", ")"))
+            else:
+                lines.append(f"var int[] event_index_{subset} = array.new<int>(0)")
+        return lines
+    
+    @staticmethod
+    def writer(fh: TextIO, encoding: str = PINE_ENCODING, subset_indices: bool = False) -> 'EventSink':
+        """Streaming writer for the given PINE_ENCODINGS entry"""
+        if encoding == 'statements':
+            return PineScriptWriter(fh, subset_indices=subset_indices)
+        if encoding in ('arrays', 'strings'):
+            return PineColumnWriter(fh, packed=encoding == 'strings', subset_indices=subset_indices)
+        raise ValueError(f"Unknown Pine encoding {encoding!r}, expected one of {PINE_ENCODINGS}")
+    
+    @staticmethod
+    def generate_pine_arrays(events: EventSequence, encoding: str = PINE_ENCODING,
+                             window: Optional[OutputWindow] = None) -> str:
+        """Generate Pine Script array definitions (only events inside window, if given)"""
+        if window is not None:
+            events = window.select(events)
+        output = io.StringIO()
+        write_events(sorted_by_time(events), [PineScriptGenerator.writer(output, encoding)])
+        return output.getvalue()
 
 
 class JSONGenerator:
     """Generate JSON output for external consumption"""
     
     @staticmethod
-    def generate_json(events: List[EconomicEvent]) -> str:
-        """Generate JSON representation of events"""
-        
-        data = {
-            'metadata': {
-                'generated_utc': datetime.now(UTC).isoformat(),
-                'total_events': len(events),
-                'timezone_display': 'BKK (UTC+7)',
-                'timezone_utc': 'UTC',
-                'next_update': (datetime.now(UTC) + timedelta(days=1)).isoformat()
-            },
-            'events': [event.to_dict() for event in events]
+    def metadata(count: int) -> Dict:
+        """Metadata block for count events"""
+        return {
+            'generated_utc': datetime.now(UTC).isoformat(),
+            'total_events': count,
+            'timezone_display': 'BKK (UTC+7)',
+            'timezone_utc': 'UTC',
+            'next_update': (datetime.now(UTC) + timedelta(days=1)).isoformat()
         }
+    
+    @staticmethod
+    def encode(obj, compact: bool = JSON_COMPACT, fast: bool = FAST_JSON) -> str:
+        """Serialize obj, indented by 2 like json.dumps(indent=2) unless compact"""
+        if fast and orjson is not None:
+            return orjson.dumps(obj, default=str, option=0 if compact else orjson.OPT_INDENT_2).decode('utf-8')
+        if compact:
+            return json.dumps(obj, separators=(',', ':'), default=str)
+        return json.dumps(obj, indent=2, default=str)
+    
+    @staticmethod
+    def generate_json(events: EventSequence, compact: bool = JSON_COMPACT, fast: bool = FAST_JSON,
+                      window: Optional[OutputWindow] = None) -> str:
+        """Generate JSON representation of events (only events inside window, if given)"""
+        if window is not None:
+            events = window.select(events)
+        output = io.StringIO()
+        write_events(events, [JSONWriter(output, compact=compact, fast=fast)])
+        return output.getvalue()
+    
+    @staticmethod
+    def generate_ndjson(events: EventSequence, fast: bool = FAST_JSON) -> str:
+        """Generate JSON Lines: one compact event object per line, in time order"""
+        output = io.StringIO()
+        write_events(events, [NDJSONWriter(output, fast=fast)])
+        return output.getvalue()
+    
+    @staticmethod
+    def iter_ndjson(fh: TextIO) -> Iterator[EconomicEvent]:
+        """Read events back from JSON Lines, one line at a time"""
+        for line in fh:
+            if line.strip():
+                yield EconomicEvent.from_dict(json.loads(line))
+
+
+# ============================================================================
+# STREAMING WRITERS
+# ============================================================================
+
+class EventSink:
+    """Receives events one at a time; close() finishes the output"""
+    
+    last_timestamp_ms: Optional[int] = None
+    
+    def write(self, event: EconomicEvent):
+        raise NotImplementedError
+    
+    def close(self):
+        pass
+    
+    def _check_sorted(self, event: EconomicEvent):
+        """Raise ValueError unless events arrive in time order"""
+        if self.last_timestamp_ms is not None and event.timestamp_ms < self.last_timestamp_ms:
+            raise ValueError(f"{type(self).__name__} needs time-sorted events: {event.name} "
+                             f"@ {event.timestamp_ms} after {self.last_timestamp_ms}")
+        self.last_timestamp_ms = event.timestamp_ms
+
+
+class _SpooledWriter(EventSink):
+    """Streams records to a file handle behind a header that needs the final count
+    
+    Records are spooled (in memory up to OUTPUT_SPOOL_MAX_BYTES, then to a
+    temp file) and copied after the header on close().
+    """
+    
+    def __init__(self, fh: TextIO, spool_max_bytes: int = OUTPUT_SPOOL_MAX_BYTES):
+        self.fh = fh
+        self.count = 0
+        self._body = tempfile.SpooledTemporaryFile(max_size=spool_max_bytes, mode='w+', encoding='utf-8')
+    
+    def write(self, event: EconomicEvent):
+        self._body.write(self.record(self.count, event))
+        self.count += 1
+    
+    def close(self):
+        self.fh.write(self.header())
+        self._body.seek(0)
+        shutil.copyfileobj(self._body, self.fh)
+        self._body.close()
+        self.fh.write(self.footer())
+    
+    def record(self, i: int, event: EconomicEvent) -> str:
+        raise NotImplementedError
+    
+    def header(self) -> str:
+        return ''
+    
+    def footer(self) -> str:
+        return ''
+
+
+class PineScriptWriter(_SpooledWriter):
+    """Streams Pine array statements to a file handle
+    
+    Events must arrive in time order: the lookup helpers appended with
+    lookup_helpers=True binary-search event_times_utc. subset_indices=True
+    also appends the event_index_<subset> arrays.
+    """
+    
+    def __init__(self, fh: TextIO, lookup_helpers: bool = PINE_LOOKUP_HELPERS, subset_indices: bool = False,
+                 spool_max_bytes: int = OUTPUT_SPOOL_MAX_BYTES):
+        super().__init__(fh, spool_max_bytes)
+        self.lookup_helpers = lookup_helpers
+        self.subset_indices = {subset: [] for subset in PINE_SUBSETS} if subset_indices else None
+    
+    def write(self, event: EconomicEvent):
+        self._check_sorted(event)
+        if self.subset_indices is not None:
+            for subset in PineScriptGenerator.subsets_of(event):
+                self.subset_indices[subset].append(self.count)
+        super().write(event)
+    
+    def record(self, i: int, event: EconomicEvent) -> str:
+        return "\n".join(PineScriptGenerator.event_lines(i, event)) + "\n"
+    
+    def header(self) -> str:
+        return "\n".join(PineScriptGenerator.header_lines(self.count)) + "\n"
+    
+    def footer(self) -> str:
+        lines = []
+        if self.subset_indices is not None:
+            lines += PineScriptGenerator.subset_index_lines(self.subset_indices) + [""]
+        if self.lookup_helpers:
+            lines += PineScriptGenerator.lookup_helper_lines()
+        return "\n".join(lines) + "\n" if lines else ''
+
+
+class PineColumnWriter(EventSink):
+    """Writes each Pine array as one literal instead of per-event statements
+    
+    Column values are collected as events arrive and written on close():
+    array.from() literals with precomputed epoch-ms times, or with packed=True
+    one PINE_DELIMITER-joined string per column that the script splits once
+    at load (times are parsed into the int array on the first bar); a column
+    with a value containing the delimiter falls back to array.from().
+    
+    With library set, the output is an importable Pine library instead, each
+    array returned by an exported function of the same name (always array.from).
+    Events must arrive in time order; scripts get the binary-search lookup
+    helpers unless lookup_helpers is False, and the event_index_<subset>
+    arrays with subset_indices=True.
+    """
+    
+    def __init__(self, fh: TextIO, packed: bool = False, values_per_line: int = PINE_VALUES_PER_LINE,
+                 library: Optional[str] = None, description: str = '',
+                 lookup_helpers: bool = PINE_LOOKUP_HELPERS, subset_indices: bool = False):
+        if packed and library:
+            raise ValueError("Pine libraries only support the 'arrays' encoding")
+        self.fh = fh
+        self.packed = packed
+        self.values_per_line = values_per_line
+        self.library = library
+        self.description = description
+        self.lookup_helpers = lookup_helpers and not library
+        self.subset_indices = {subset: [] for subset in PINE_SUBSETS} if subset_indices else None
+        self.count = 0
+        self.columns: List[list] = [[] for _ in PineScriptGenerator.COLUMNS]
+    
+    def write(self, event: EconomicEvent):
+        self._check_sorted(event)
+        if self.subset_indices is not None:
+            for subset in PineScriptGenerator.subsets_of(event):
+                self.subset_indices[subset].append(self.count)
+        for values, (_, _, value) in zip(self.columns, PineScriptGenerator.COLUMNS):
+            values.append(value(event))
+        self.count += 1
+    
+    def close(self):
+        if self.library:
+            lines = self._library_lines()
+        else:
+            lines = self._script_lines()
+        self.fh.write("\n".join(lines) + "\n")
+        self.columns = [[] for _ in PineScriptGenerator.COLUMNS]
+    
+    def _script_lines(self) -> List[str]:
+        lines = PineScriptGenerator.banner_lines(self.count, 'strings' if self.packed else 'arrays')
+        for (name, kind, _), values in zip(PineScriptGenerator.COLUMNS, self.columns):
+            if not values:
+                lines.append(f"var {kind}[] {name} = array.new<{kind}>(0)")
+            elif self.packed:
+                lines.extend(self._split_declaration(name, kind, values))
+            else:
+                lines.extend(self._array_declaration(name, kind, values))
+        if self.subset_indices is not None:
+            lines += [""] + PineScriptGenerator.subset_index_lines(self.subset_indices)
+        if self.lookup_helpers:
+            lines += [""] + PineScriptGenerator.lookup_helper_lines()
+        return lines
+    
+    def _library_lines(self) -> List[str]:
+        lines = ["//@version=5"] + PineScriptGenerator.banner_lines(self.count, 'library')[:-2] + [
+            f"// @description {self.description or self.library}",
+            f"library(\"{self.library}\")",
+            "",
+            "// @function Number of events in this library",
+            f"export event_count() => {self.count}",
+        ]
+        for (name, kind, _), values in zip(PineScriptGenerator.COLUMNS, self.columns):
+            lines += ["", f"// @function {name} column, time-sorted", f"export {name}() =>"]
+            if not values:
+                lines.append(f"    array.new<{kind}>(0)")
+                continue
+            literals = [str(v) for v in values] if kind == 'int' else [pine_string(v) for v in values]
+            lines.extend(self._wrap("    array.from(", literals, ", ", ")", indent="      "))
+        return lines
+    
+    def _wrap(self, prefix: str, items: List[str], sep: str, suffix: str, indent: str = "  ") -> List[str]:
+        return pine_wrap(prefix, items, sep, suffix, indent, self.values_per_line)
+    
+    def _array_declaration(self, name: str, kind: str, values: list) -> List[str]:
+        literals = [str(v) for v in values] if kind == 'int' else [pine_string(v) for v in values]
+        return self._wrap(f"var {kind}[] {name} = array.from(", literals, ", ", ")")
+    
+    def _split_declaration(self, name: str, kind: str, values: list) -> List[str]:
+        delimiter = PINE_DELIMITER
+        items = [str(v) for v in values]
+        clashes = [v for v in items if delimiter in v]
+        if clashes:
+            # Splitting would break the value apart; keep this column as array.from
+            logger.warning(f"Pine delimiter {delimiter!r} appears in {name} value {clashes[0]!r}, "
+                           f"writing {name} with array.from")
+            return self._array_declaration(name, kind, values)
+        
+        # One string literal per line of values, concatenated with +
+        step = self.values_per_line
+        literals = [pine_string(delimiter.join(items[i:i + step]) + (delimiter if i + step < len(items) else ''))
+                    for i in range(0, len(items), step)]
+        packed = [("  " if i else "") + literal + (" +" if i < len(literals) - 1 else "")
+                  for i, literal in enumerate(literals)]
+        if kind == 'string':
+            packed[0] = f"var string[] {name} = str.split(" + packed[0]
+            packed[-1] += f", {pine_string(delimiter)})"
+            return packed
+        
+        packed[0] = f"var string {name}_packed = " + packed[0]
+        return packed + [
+            f"var {kind}[] {name} = array.new<{kind}>(0)",
+            "if barstate.isfirst",
+            f"    for value in str.split({name}_packed, {pine_string(delimiter)})",
+            f"        array.push({name}, {kind}(str.tonumber(value)))",
+        ]
+
+
+class PineSplitWriter(EventSink):
+    """Writes one events_<subset>.pine per PINE_SUBSETS entry
+    
+    Each file holds only that subset's events, under the same array names
+    and helpers as events.pine, so an indicator can load just what it draws.
+    Every file is created, even when its subset is empty.
+    """
+    
+    def __init__(self, directory: str, encoding: str = PINE_ENCODING, subsets: Tuple[str, ...] = PINE_SUBSETS):
+        os.makedirs(directory, exist_ok=True)
+        self.subsets = subsets
+        self._files = {subset: open(os.path.join(directory, f"events_{subset}.pine"), 'w', encoding='utf-8')
+                       for subset in subsets}
+        self._writers = {subset: PineScriptGenerator.writer(fh, encoding) for subset, fh in self._files.items()}
+    
+    def write(self, event: EconomicEvent):
+        for subset in PineScriptGenerator.subsets_of(event, self.subsets):
+            self._writers[subset].write(event)
+    
+    def close(self):
+        for subset, writer in self._writers.items():
+            writer.close()
+            self._files[subset].close()
+
+
+class ChunkedPineWriter(EventSink):
+    """Splits time-sorted events into one Pine library per quarter or year
+    
+    Each period with events becomes <prefix>_<period>.pine (see
+    PineColumnWriter's library mode); only one period is buffered at a time.
+    On close() <prefix>_index.pine is written: a library whose chunk_for(t)
+    binary-searches the chunk start times, so a chart script can call just
+    the chunk covering the current bar.
+    """
+    
+    PERIODS = ('quarter', 'year')
+    
+    def __init__(self, directory: str, period: str = PINE_CHUNK_PERIOD, prefix: str = PINE_LIBRARY_PREFIX):
+        if period not in self.PERIODS:
+            raise ValueError(f"Unknown chunk period {period!r}, expected one of {self.PERIODS}")
+        self.directory = directory
+        self.period = period
+        self.prefix = prefix
+        self.count = 0
+        self.chunks: List[Tuple[int, str]] = []   # (period start epoch-ms, library name)
+        self._file: Optional[TextIO] = None
+        self._writer: Optional[PineColumnWriter] = None
+        self._period_end_ms = 0
+        os.makedirs(directory, exist_ok=True)
+    
+    def _period_bounds(self, timestamp_ms: int) -> Tuple[int, int, str]:
+        """(start ms, end ms, label) of the period containing timestamp_ms"""
+        day = date.fromordinal(EPOCH_ORDINAL + timestamp_ms // MS_PER_DAY)
+        if self.period == 'year':
+            start, end, label = date(day.year, 1, 1), date(day.year + 1, 1, 1), str(day.year)
+        else:
+            quarter = (day.month - 1) // 3
+            start = date(day.year, 3 * quarter + 1, 1)
+            end = date(day.year + 1, 1, 1) if quarter == 3 else date(day.year, 3 * quarter + 4, 1)
+            label = f"{day.year}_Q{quarter + 1}"
+        return ((start.toordinal() - EPOCH_ORDINAL) * MS_PER_DAY,
+                (end.toordinal() - EPOCH_ORDINAL) * MS_PER_DAY, label)
+    
+    def write(self, event: EconomicEvent):
+        if self._writer is None or event.timestamp_ms >= self._period_end_ms:
+            start_ms, self._period_end_ms, label = self._period_bounds(event.timestamp_ms)
+            if self.chunks and start_ms <= self.chunks[-1][0]:
+                raise ValueError(f"Chunked Pine events must be time-sorted: {event.name} "
+                                 f"@ {event.timestamp_ms} is before the current chunk")
+            self._close_chunk()
+            library = f"{self.prefix}_{label}"
+            self._file = open(os.path.join(self.directory, library + '.pine'), 'w', encoding='utf-8')
+            self._writer = PineColumnWriter(self._file, library=library,
+                                            description=f"US economic events, {label.replace('_', ' ')}")
+            self.chunks.append((start_ms, library))
+        self._writer.write(event)
+        self.count += 1
+    
+    def _close_chunk(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._file.close()
+            self._writer = self._file = None
+    
+    def close(self):
+        self._close_chunk()
+        library = f"{self.prefix}_index"
+        with open(os.path.join(self.directory, library + '.pine'), 'w', encoding='utf-8') as f:
+            f.write("\n".join(self._index_lines(library)) + "\n")
+    
+    def _index_lines(self, library: str) -> List[str]:
+        starts = ", ".join(str(start_ms) for start_ms, _ in self.chunks)
+        names = ", ".join(pine_string(name) for _, name in self.chunks)
+        return ["//@version=5"] + PineScriptGenerator.banner_lines(self.count, 'library index')[:-2] + [
+            f"// Chunks: {len(self.chunks)} (one library per {self.period})",
+            "// Usage: import the chunk libraries, then call the arrays of the chunk",
+            "// whose name is array.get(chunk_names(), chunk_for(time))",
+            "// @description Maps bar time to the US event library covering it",
+            f"library(\"{library}\")",
+            "",
+            "// @function Period start time (UTC epoch ms) of each chunk, ascending",
+            f"export chunk_starts() => array.from({starts})" if self.chunks else
+            "export chunk_starts() => array.new<int>(0)",
+            "",
+            "// @function Library name of each chunk",
+            f"export chunk_names() => array.from({names})" if self.chunks else
+            "export chunk_names() => array.new<string>(0)",
+            "",
+            "// @function Index of the last chunk starting at or before t (-1 if none)",
+            "export chunk_for(int t) =>",
+            "    int[] starts = chunk_starts()",
+            "    int lo = 0",
+            "    int hi = array.size(starts)",
+            "    while lo < hi",
+            "        int mid = math.floor((lo + hi) / 2)",
+            "        if array.get(starts, mid) <= t",
+            "            lo := mid + 1",
+            "        else",
+            "            hi := mid",
+            "    lo - 1",
+        ]
+
+
+class JSONWriter(_SpooledWriter):
+    """Streams the events.json document to a file handle
+    
+    Events are encoded batch_size at a time as one list, so the encoder
+    call and re-indent cost is paid per batch rather than per event; the
+    output matches json.dumps({'metadata': ..., 'events': [...]}, indent=2),
+    or the separator-only form when compact.
+    """
+    
+    def __init__(self, fh: TextIO, compact: bool = JSON_COMPACT, fast: bool = FAST_JSON,
+                 batch_size: int = JSON_BATCH_SIZE, spool_max_bytes: int = OUTPUT_SPOOL_MAX_BYTES):
+        super().__init__(fh, spool_max_bytes)
+        self.compact = compact
+        self.fast = fast
+        self.batch_size = batch_size
+        self._batch: List[Dict] = []
+        self._encoded = 0
+    
+    def write(self, event: EconomicEvent):
+        self._batch.append(event.to_dict())
+        self.count += 1
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+    
+    def _flush(self):
+        if not self._batch:
+            return
+        text = JSONGenerator.encode(self._batch, self.compact, self.fast)
+        if self.compact:
+            body = text[1:-1]
+        else:
+            # Drop the list's '[' and '\n]', then nest two levels deep: under
+            # "events" inside the top-level object
+            body = text[1:-2].replace('\n', '\n  ')
+        self._body.write(',' + body if self._encoded else body)
+        self._encoded += len(self._batch)
+        self._batch.clear()
+    
+    def close(self):
+        self._flush()
+        super().close()
+    
+    def header(self) -> str:
+        metadata = JSONGenerator.encode(JSONGenerator.metadata(self.count), self.compact, self.fast)
+        if self.compact:
+            return '{"metadata":' + metadata + ',"events":['
+        return '{\n  "metadata": ' + metadata.replace('\n', '\n  ') + ',\n  "events": ['
+    
+    def footer(self) -> str:
+        if self.compact:
+            return ']}'
+        return '\n  ]\n}' if self.count else ']\n}'
+
+
+class NDJSONWriter(EventSink):
+    """Streams events as JSON Lines, one compact object per line
+    
+    There is no header, so each line is written straight through and the file
+    can be tailed, grepped, appended to or read from any line boundary. Events
+    must arrive in time order (as the pipeline produces them); pass the last
+    timestamp already in the file when appending.
+    """
+    
+    def __init__(self, fh: TextIO, fast: bool = FAST_JSON, last_timestamp_ms: Optional[int] = None):
+        self.fh = fh
+        self.fast = fast
+        self.count = 0
+        self.last_timestamp_ms = last_timestamp_ms
+    
+    def write(self, event: EconomicEvent):
+        self._check_sorted(event)
+        self.fh.write(JSONGenerator.encode(event.to_dict(), compact=True, fast=self.fast) + '\n')
+        self.count += 1
+
+
+def write_events(events: Iterable[EconomicEvent], sinks: List[EventSink],
+                 sample_size: int = 0) -> Tuple[int, List[EconomicEvent]]:
+    """Push every event to every sink, then close them
+    
+    Returns the event count and the first sample_size events.
+    """
+    count = 0
+    sample = []
+    for event in events:
+        for sink in sinks:
+            sink.write(event)
+        if count < sample_size:
+            sample.append(event)
+        count += 1
+    for sink in sinks:
+        sink.close()
+    return count, sample
+
+
+# ============================================================================
+# BINARY EVENT FILE
+# ============================================================================
+
+class BinaryEventFormat:
+    """Layout of events.bin (all integers little-endian)
+    
+    header:  magic, version, record size, record count, string table offset
+             (relative to the header), padded to 24 bytes so every record's
+             int64 timestamp is 8-byte aligned
+    records: fixed width, sorted by time: int64 epoch-ms, uint8 impact code,
+             then uint32 string table offsets for name, source, forecast,
+             previous, actual and contributors (joined by \\x1f);
+             NO_STRING marks None
+    strings: uint32 byte length + UTF-8 bytes, each distinct string stored once
+    """
+    
+    MAGIC = b'USEV'
+    VERSION = 2
+    HEADER = struct.Struct('<4sHHIQ4x')
+    RECORD = struct.Struct('<qB3x6I4x')
+    TIMESTAMP = struct.Struct('<q')
+    STRING_LENGTH = struct.Struct('<I')
+    NO_STRING = 0xFFFFFFFF
+    IMPACTS = ('Low', 'Medium', 'High')
+    IMPACT_CODES = {impact: code for code, impact in enumerate(IMPACTS)}
+    CONTRIBUTOR_SEP = EventTable._CONTRIBUTOR_SEP
+
+
+class BinaryEventWriter(EventSink):
+    """Streams time-sorted events to events.bin
+    
+    Records go straight to the (binary, seekable) file handle; the string
+    table is kept in memory and appended on close(), then the header is
+    rewritten with the final count and table offset. Writing can start at
+    any file position; read it back with EventFile(path, offset=position).
+    """
+    
+    def __init__(self, fh):
+        self.fh = fh
+        self.count = 0
+        self._strings = bytearray()
+        self._offsets: Dict[str, int] = {}
+        self._start = fh.tell()
+        fh.write(self._header(0, 0))
+    
+    def _header(self, count: int, strings_offset: int) -> bytes:
+        fmt = BinaryEventFormat
+        return fmt.HEADER.pack(fmt.MAGIC, fmt.VERSION, fmt.RECORD.size, count, strings_offset)
+    
+    def _string(self, value: Optional[str]) -> int:
+        if value is None:
+            return BinaryEventFormat.NO_STRING
+        offset = self._offsets.get(value)
+        if offset is None:
+            data = value.encode('utf-8')
+            offset = self._offsets[value] = len(self._strings)
+            self._strings += BinaryEventFormat.STRING_LENGTH.pack(len(data))
+            self._strings += data
+        return offset
+    
+    def write(self, event: EconomicEvent):
+        fmt = BinaryEventFormat
+        impact = fmt.IMPACT_CODES.get(event.impact)
+        if impact is None:
+            raise ValueError(f"No binary impact code for {event.impact!r} ({event.name})")
         
-        return json.dumps(data, indent=2, default=str)
+        self._check_sorted(event)
+        self.fh.write(fmt.RECORD.pack(
+            event.timestamp_ms, impact,
+            self._string(event.name), self._string(event.source),
+            self._string(event.forecast), self._string(event.previous), self._string(event.actual),
+            self._string(fmt.CONTRIBUTOR_SEP.join(event.contributors)),
+        ))
+        self.count += 1
+    
+    def close(self):
+        strings_offset = self.fh.tell() - self._start
+        self.fh.write(self._strings)
+        end = self.fh.tell()
+        self.fh.seek(self._start)
+        self.fh.write(self._header(self.count, strings_offset))
+        self.fh.seek(end)
+
+
+class _TimestampColumn:
+    """Read-only sequence view of the record timestamps (for bisect), no copies"""
+    
+    __slots__ = ('buffer', 'count', 'start')
+    
+    def __init__(self, buffer, count: int, start: int):
+        self.buffer = buffer
+        self.count = count
+        self.start = start
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __getitem__(self, i: int) -> int:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        offset = self.start + i * BinaryEventFormat.RECORD.size
+        return BinaryEventFormat.TIMESTAMP.unpack_from(self.buffer, offset)[0]
+
+
+class EventFile:
+    """Memory-mapped events.bin reader
+    
+    Opening only validates the header; records are decoded on access straight
+    from the mapping, and time lookups binary-search the timestamp column.
+    offset is where the header starts (where BinaryEventWriter began writing);
+    keep it a multiple of 8 so the timestamps stay aligned.
+    """
+    
+    def __init__(self, path: str, offset: int = 0):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        fmt = BinaryEventFormat
+        try:
+            magic, version, record_size, count, strings_offset = fmt.HEADER.unpack_from(self._mmap, offset)
+        except struct.error:
+            magic = None
+        if magic != fmt.MAGIC or version != fmt.VERSION or record_size != fmt.RECORD.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {fmt.VERSION} event file at offset {offset}")
+        self.count = count
+        self._records_offset = offset + fmt.HEADER.size
+        self._strings_offset = offset + strings_offset
+        self.timestamps = _TimestampColumn(self._mmap, count, self._records_offset)
+    
+    def __enter__(self) -> 'EventFile':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        self._mmap.close()
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def _string(self, offset: int) -> Optional[str]:
+        if offset == BinaryEventFormat.NO_STRING:
+            return None
+        start = self._strings_offset + offset
+        length, = BinaryEventFormat.STRING_LENGTH.unpack_from(self._mmap, start)
+        start += BinaryEventFormat.STRING_LENGTH.size
+        return str(self._mmap[start:start + length], 'utf-8')
+    
+    def __getitem__(self, i: int) -> EconomicEvent:
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        fmt = BinaryEventFormat
+        (timestamp_ms, impact, name, source, forecast, previous, actual,
+         contributors) = fmt.RECORD.unpack_from(self._mmap, self._records_offset + i * fmt.RECORD.size)
+        contributors = self._string(contributors)
+        return EconomicEvent.from_timestamp_ms(
+            self._string(name), timestamp_ms, fmt.IMPACTS[impact],
+            forecast=self._string(forecast), previous=self._string(previous),
+            actual=self._string(actual), source=self._string(source),
+            contributors=tuple(contributors.split(fmt.CONTRIBUTOR_SEP)) if contributors else None,
+        )
+    
+    def __iter__(self) -> Iterator[EconomicEvent]:
+        return (self[i] for i in range(self.count))
+    
+    def index_at(self, timestamp_ms: int) -> int:
+        """Index of the first event at or after timestamp_ms"""
+        return bisect.bisect_left(self.timestamps, timestamp_ms)
+    
+    def between(self, start_ms: int, end_ms: int) -> Iterator[EconomicEvent]:
+        """Events with start_ms <= timestamp < end_ms"""
+        lo = self.index_at(start_ms)
+        hi = bisect.bisect_left(self.timestamps, end_ms, lo)
+        return (self[i] for i in range(lo, hi))
+    
+    def next_event(self, timestamp_ms: int) -> Optional[EconomicEvent]:
+        """First event at or after timestamp_ms, if any"""
+        i = self.index_at(timestamp_ms)
+        return self[i] if i < self.count else None
 
 
 # ============================================================================
@@ -579,42 +2815,58 @@ def main():
     logger.info("US Economic Event Fetcher - Starting")
     logger.info("=" * 80)
     
+    outputs = ['events.pine', 'events.json', 'events.ndjson', 'events.bin']
+    tmp_outputs = [path + '.tmp' for path in outputs]
+    tmp_pine_dir = PINE_DIR + '.tmp'
+    shutil.rmtree(tmp_pine_dir, ignore_errors=True)
+    
     try:
-        # Aggregate events
+        # Merge every source into one compact time-sorted table, then keep
+        # the high/medium impact rows inside the output window
+        window = OutputWindow(OUTPUT_LOOKBACK_DAYS, OUTPUT_LOOKAHEAD_DAYS)
         aggregator = EventAggregator()
-        all_events = aggregator.fetch_all(days_ahead=365)
+        table = EventTable.from_events(aggregator.iter_events(days_ahead=math.ceil(OUTPUT_LOOKAHEAD_DAYS),
+                                                              impacts=None, days_back=OUTPUT_LOOKBACK_DAYS))
+        logger.info(f"Total unique events: {len(table)}")
+        table = aggregator.filter_high_medium(table)
+        events = window.select(table)
+        logger.info(f"Output window: {OUTPUT_LOOKBACK_DAYS} days back, {OUTPUT_LOOKAHEAD_DAYS} days ahead")
         
-        # Filter to high/medium impact
-        filtered_events = aggregator.filter_high_medium(all_events)
+        logger.info("Generating Pine Script, JSON, NDJSON and binary output...")
+        with open(tmp_outputs[0], 'w', encoding='utf-8') as pine_file, \
+                open(tmp_outputs[1], 'w', encoding='utf-8') as json_file, \
+                open(tmp_outputs[2], 'w', encoding='utf-8') as ndjson_file, \
+                open(tmp_outputs[3], 'wb') as binary_file:
+            sinks = [PineScriptGenerator.writer(pine_file, subset_indices=PINE_SPLIT_MODE == 'arrays'),
+                     JSONWriter(json_file), NDJSONWriter(ndjson_file),
+                     BinaryEventWriter(binary_file)]
+            if PINE_CHUNK_PERIOD:
+                sinks.append(ChunkedPineWriter(tmp_pine_dir, PINE_CHUNK_PERIOD))
+            if PINE_SPLIT_MODE == 'files':
+                sinks.append(PineSplitWriter(tmp_pine_dir))
+            count, sample = write_events(events, sinks, sample_size=5)
         
-        if not filtered_events:
+        if not count:
             logger.error("No events fetched. Check internet connection and source availability.")
             return False
         
-        # Generate outputs
-        logger.info("Generating Pine Script output...")
-        pine_script = PineScriptGenerator.generate_pine_arrays(filtered_events)
-        
-        logger.info("Generating JSON output...")
-        json_output = JSONGenerator.generate_json(filtered_events)
-        
-        # Save outputs
-        with open('events.pine', 'w') as f:
-            f.write(pine_script)
-        logger.info("Saved: events.pine")
-        
-        with open('events.json', 'w') as f:
-            f.write(json_output)
-        logger.info("Saved: events.json")
+        # Save outputs (only replace the previous files once everything was written)
+        for tmp_path, path in zip(tmp_outputs, outputs):
+            os.replace(tmp_path, path)
+            logger.info(f"Saved: {path}")
+        if os.path.isdir(tmp_pine_dir):
+            shutil.rmtree(PINE_DIR, ignore_errors=True)
+            os.replace(tmp_pine_dir, PINE_DIR)
+            logger.info(f"Saved: {PINE_DIR}/ ({len(os.listdir(PINE_DIR))} Pine files)")
         
         # Print summary
         logger.info("=" * 80)
-        logger.info(f"SUCCESS: Fetched {len(filtered_events)} high/medium impact US events")
+        logger.info(f"SUCCESS: Fetched {count} high/medium impact US events")
         logger.info("=" * 80)
         
         # Print first 5 events as sample
         logger.info("\nSample events:")
-        for event in filtered_events[:5]:
+        for event in sample:
             logger.info(f"  • {event.name} @ {event.event_time_utc.strftime('%Y-%m-%d %H:%M UTC')} ({event.impact})")
         
         return True
@@ -622,6 +2874,12 @@ def main():
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
         return False
+    
+    finally:
+        for tmp_path in tmp_outputs:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        shutil.rmtree(tmp_pine_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":